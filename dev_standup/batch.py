@@ -0,0 +1,509 @@
+"""
+Batch report runner for scheduled, org-wide standup generation.
+
+A job spec (JSON) lists repositories, people and moods. Every
+repo x person x mood combination is one unit of work. Repositories are
+scanned once on a bounded scan pool, the LLM calls run on a separate bounded
+pool, and every finished unit is appended to a checkpoint file so a crashed
+or interrupted run picks up where it stopped.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import click
+
+from dev_standup.config import Config
+from dev_standup.git_scanner import CommitInfo, GitScanner, format_commits_for_llm
+from dev_standup.summarizer import BaseSummarizer, create_summarizer, preload_model
+from dev_standup.cli import print_error, print_info, print_success, print_warning
+
+EVERYONE = "*"
+
+
+@dataclass
+class BatchJob:
+    """A batch job specification."""
+    repos: List[Path]
+    people: List[str] = field(default_factory=lambda: [EVERYONE])
+    moods: List[str] = field(default_factory=lambda: [Config.DEFAULT_MOOD])
+    hours: int = Config.DEFAULT_HOURS
+    diff_context: bool = False
+    paths: List[str] = field(default_factory=list)
+    
+    @classmethod
+    def load(cls, path: Path) -> "BatchJob":
+        """
+        Load a job spec from a JSON file.
+        
+        The file may list repositories explicitly (``repos``), name a
+        directory to discover them under (``search_root``), or both.
+        
+        Args:
+            path: Path to the JSON job spec
+        
+        Returns:
+            Parsed BatchJob
+        
+        Raises:
+            ValueError: If the spec is malformed
+        """
+        with open(path, encoding="utf-8") as f:
+            spec = json.load(f)
+        
+        repos = [Path(p).expanduser() for p in spec.get("repos", [])]
+        if spec.get("search_root"):
+            root = Path(spec["search_root"]).expanduser()
+            repos.extend(GitScanner().find_repositories(root))
+        if not repos:
+            raise ValueError("Job spec must list 'repos' or a 'search_root'")
+        
+        moods = [m.lower() for m in spec.get("moods", [Config.DEFAULT_MOOD])]
+        for mood in moods:
+            if mood not in ("neutral", "roast", "hero"):
+                raise ValueError(f"Invalid mood in job spec: {mood}")
+        
+        # Deduplicate while keeping the spec's order
+        repos = list(dict.fromkeys(p.resolve() for p in repos))
+        
+        return cls(
+            repos=repos,
+            people=spec.get("people") or [EVERYONE],
+            moods=moods,
+            hours=int(spec.get("hours", Config.DEFAULT_HOURS)),
+            diff_context=bool(spec.get("diff_context", False)),
+            paths=list(spec.get("paths", [])),
+        )
+    
+    def fingerprint(self) -> str:
+        """
+        Short hash of the settings that shape every unit's summary.
+        
+        Covers the scan window, path filters, diff context and the provider
+        chain with its models, so editing any of them starts fresh units
+        instead of resuming stale ones.
+        
+        Returns:
+            8-character hex digest
+        """
+        settings = {
+            "hours": self.hours,
+            "paths": sorted(self.paths),
+            "diff_context": self.diff_context,
+            "models": Config.model_chain(),
+        }
+        canonical = json.dumps(settings, sort_keys=True)
+        return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:8]
+
+
+@dataclass
+class BatchStats:
+    """Throughput and latency figures for a batch run."""
+    units_total: int = 0
+    units_done: int = 0
+    units_resumed: int = 0
+    units_failed: int = 0
+    repos_scanned: int = 0
+    wall_time: float = 0.0
+    scan_latencies: List[float] = field(default_factory=list)
+    llm_latencies: List[float] = field(default_factory=list)
+    
+    def format(self) -> str:
+        """Render the stats as a short multi-line report."""
+        throughput = self.units_done / self.wall_time if self.wall_time else 0.0
+        lines = [
+            f"Units: {self.units_done} done, {self.units_resumed} resumed, "
+            f"{self.units_failed} failed (of {self.units_total})",
+            f"Repos scanned: {self.repos_scanned}",
+            f"Wall time: {self.wall_time:.1f}s | Throughput: {throughput:.2f} units/s",
+            f"Scan latency: {_latency_line(self.scan_latencies)}",
+            f"LLM latency:  {_latency_line(self.llm_latencies)}",
+        ]
+        return "\n".join(lines)
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def _latency_line(values: List[float]) -> str:
+    if not values:
+        return "n/a"
+    return (
+        f"p50 {_percentile(values, 50):.2f}s, "
+        f"p95 {_percentile(values, 95):.2f}s, "
+        f"max {max(values):.2f}s"
+    )
+
+
+class Checkpoint:
+    """Append-only record of completed units, safe to share between threads."""
+    
+    def __init__(self, path: Path):
+        """
+        Open (or create) a checkpoint file.
+        
+        Args:
+            path: Location of the JSON-lines checkpoint file
+        """
+        self.path = path
+        self.completed: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        
+        if path.exists():
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A crash mid-write leaves a torn last line; skip it
+                        continue
+                    self.completed[entry["key"]] = entry
+    
+    def record(self, entry: dict):
+        """Durably append a completed unit."""
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self.completed[entry["key"]] = entry
+
+
+def unit_key(repo: Path, person: str, mood: str, fingerprint: str) -> str:
+    """Stable identifier for a repo x person x mood unit under one job fingerprint."""
+    return f"{repo}|{person}|{mood}|{fingerprint}"
+
+
+def filter_commits(commits: List[CommitInfo], person: str) -> List[CommitInfo]:
+    """Keep the commits authored by ``person`` (email or name, case-insensitive)."""
+    if person == EVERYONE:
+        return commits
+    wanted = person.lower()
+    return [
+        c for c in commits
+        if c.author_email.lower() == wanted or c.author.lower() == wanted
+    ]
+
+
+class BatchRunner:
+    """Runs a BatchJob with bounded scan and LLM pools and resumable state."""
+    
+    def __init__(
+        self,
+        job: BatchJob,
+        state_dir: Path,
+        scan_workers: int = 4,
+        llm_workers: int = 2,
+        retries: int = 2,
+        max_consecutive_failures: int = 5
+    ):
+        """
+        Initialize the runner.
+        
+        Args:
+            job: Job to run
+            state_dir: Directory for the checkpoint and the final report
+            scan_workers: Number of concurrent repository scans
+            llm_workers: Number of concurrent LLM requests
+            retries: Extra attempts per unit after an LLM failure
+            max_consecutive_failures: Stop scheduling new LLM work after this
+                many failed units in a row (the backend is likely down)
+        """
+        self.job = job
+        self.state_dir = state_dir
+        self.scan_workers = max(1, scan_workers)
+        self.llm_workers = max(1, llm_workers)
+        self.retries = max(0, retries)
+        self.max_consecutive_failures = max_consecutive_failures
+        
+        self.checkpoint = Checkpoint(state_dir / "checkpoint.jsonl")
+        self.fingerprint = job.fingerprint()
+        self.stats = BatchStats()
+        self._summarizers: Dict[str, BaseSummarizer] = {}
+        self._stats_lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._outage = threading.Event()
+    
+    def run(self) -> BatchStats:
+        """
+        Run every unit that is not already in the checkpoint.
+        
+        Returns:
+            Stats for this run
+        """
+        started = time.perf_counter()
+        
+        pending: Dict[Path, List[Tuple[str, str]]] = {}
+        for repo in self.job.repos:
+            for person in self.job.people:
+                for mood in self.job.moods:
+                    self.stats.units_total += 1
+                    if unit_key(repo, person, mood, self.fingerprint) in self.checkpoint.completed:
+                        self.stats.units_resumed += 1
+                    else:
+                        pending.setdefault(repo, []).append((person, mood))
+        
+        for mood in {mood for units in pending.values() for _, mood in units}:
+            self._summarizers[mood] = create_summarizer(mood=mood)
+        
+        if pending:
+            # Load the model while the first repositories are scanned
+            threading.Thread(target=preload_model, daemon=True).start()
+        
+        scanner = GitScanner(
+            hours=self.job.hours,
+            all_authors=True,
+            diff_context=self.job.diff_context,
+            paths=self.job.paths
+        )
+        
+        # Cap queued LLM work so finished scans wait instead of piling up
+        in_flight = threading.BoundedSemaphore(self.llm_workers * 4)
+        
+        with scanner, \
+                ThreadPoolExecutor(self.scan_workers, thread_name_prefix="scan") as scan_pool, \
+                ThreadPoolExecutor(self.llm_workers, thread_name_prefix="llm") as llm_pool:
+            scan_futures = {
+                scan_pool.submit(self._timed_scan, scanner, repo): repo
+                for repo in pending
+            }
+            llm_futures = []
+            
+            for future in as_completed(scan_futures):
+                repo = scan_futures[future]
+                commits = future.result()
+                
+                # Filter and format once per person, shared by all their moods
+                shared: Dict[str, Tuple[List[CommitInfo], str]] = {}
+                for person, mood in pending[repo]:
+                    if self._outage.is_set():
+                        break
+                    if person not in shared:
+                        person_commits = filter_commits(commits, person)
+                        shared[person] = (person_commits, format_commits_for_llm(person_commits))
+                    person_commits, commits_text = shared[person]
+                    in_flight.acquire()
+                    llm_future = llm_pool.submit(
+                        self._run_unit, repo, person, mood, person_commits, commits_text
+                    )
+                    llm_future.add_done_callback(lambda _: in_flight.release())
+                    llm_futures.append(llm_future)
+            
+            for llm_future in llm_futures:
+                llm_future.result()
+        
+        unscheduled = self.stats.units_total - (
+            self.stats.units_done + self.stats.units_resumed + self.stats.units_failed
+        )
+        self.stats.units_failed += unscheduled
+        self.stats.wall_time = time.perf_counter() - started
+        self.write_report()
+        return self.stats
+    
+    def _timed_scan(self, scanner: GitScanner, repo: Path) -> List[CommitInfo]:
+        started = time.perf_counter()
+        commits = scanner.scan_repository(repo)
+        elapsed = time.perf_counter() - started
+        with self._stats_lock:
+            self.stats.repos_scanned += 1
+            self.stats.scan_latencies.append(elapsed)
+        return commits
+    
+    def _run_unit(
+        self,
+        repo: Path,
+        person: str,
+        mood: str,
+        commits: List[CommitInfo],
+        commits_text: str
+    ):
+        if self._outage.is_set():
+            return
+        
+        summary = "No commits to summarize."
+        elapsed = 0.0
+        
+        if commits:
+            summarizer = self._summarizers[mood]
+            for attempt in range(self.retries + 1):
+                started = time.perf_counter()
+                try:
+                    summary = summarizer.generate(commits, commits_text=commits_text)
+                    elapsed = time.perf_counter() - started
+                    break
+                except Exception as e:
+                    if attempt == self.retries:
+                        self._record_failure(repo, person, mood, e)
+                        return
+                    time.sleep(2 ** attempt)
+        
+        self.checkpoint.record({
+            "key": unit_key(repo, person, mood, self.fingerprint),
+            "repo": str(repo),
+            "person": person,
+            "mood": mood,
+            "commits": [c.sha for c in commits],
+            "summary": summary,
+            "latency": round(elapsed, 3),
+        })
+        
+        with self._stats_lock:
+            self.stats.units_done += 1
+            self._consecutive_failures = 0
+            if commits:
+                self.stats.llm_latencies.append(elapsed)
+    
+    def _record_failure(self, repo: Path, person: str, mood: str, error: Exception):
+        print_warning(f"Failed {repo.name} / {person} / {mood}: {error}")
+        with self._stats_lock:
+            self.stats.units_failed += 1
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self.max_consecutive_failures:
+                if not self._outage.is_set():
+                    print_error(
+                        f"{self._consecutive_failures} consecutive LLM failures - "
+                        "stopping; re-run to resume"
+                    )
+                self._outage.set()
+    
+    def write_report(self) -> Path:
+        """
+        Write a markdown report of every completed unit, grouped by person.
+        
+        Returns:
+            Path to the report
+        """
+        by_person: Dict[str, List[dict]] = {}
+        for key, entry in self.checkpoint.completed.items():
+            if not key.endswith(f"|{self.fingerprint}"):
+                continue  # Written under different job settings
+            by_person.setdefault(entry["person"], []).append(entry)
+        
+        lines = []
+        for person in self.job.people:
+            # Units without commits have nothing to report
+            entries = [e for e in by_person.get(person, []) if e["commits"]]
+            if not entries:
+                continue
+            title = "Everyone" if person == EVERYONE else person
+            lines.append(f"# {title}\n")
+            for entry in sorted(entries, key=lambda e: (e["repo"], e["mood"])):
+                lines.append(f"## {Path(entry['repo']).name} ({entry['mood']})\n")
+                lines.append(entry["summary"] + "\n")
+        
+        report_path = self.state_dir / "report.md"
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        report_path.write_text("\n".join(lines), encoding="utf-8")
+        return report_path
+
+
+@click.command()
+@click.argument("job_file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--state-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Checkpoint/report directory (default: .dev-standup-batch/<job>-<date>-<settings hash>)"
+)
+@click.option(
+    "--scan-workers",
+    type=int,
+    default=Config.BATCH_SCAN_WORKERS,
+    help="Concurrent repository scans"
+)
+@click.option(
+    "--llm-workers",
+    type=int,
+    default=Config.BATCH_LLM_WORKERS,
+    help="Concurrent LLM requests"
+)
+@click.option(
+    "--retries",
+    type=int,
+    default=2,
+    help="Retries per unit after an LLM failure"
+)
+@click.option(
+    "--provider",
+    type=click.Choice(["openai", "ollama", "extractive"], case_sensitive=False),
+    default=None,
+    help="LLM provider to use (overrides .env setting)"
+)
+def main(
+    job_file: Path,
+    state_dir: Optional[Path],
+    scan_workers: int,
+    llm_workers: int,
+    retries: int,
+    provider: Optional[str]
+):
+    """
+    Run a batch of standup reports from a JSON job spec.
+    
+    Completed units are checkpointed; re-running the same command resumes
+    after a crash or LLM outage.
+    
+    Example job spec:
+        
+        {"repos": ["~/src/api"], "search_root": "~/src/services",
+         "people": ["alice@example.com"], "moods": ["neutral"], "hours": 24}
+    """
+    if provider:
+        Config.LLM_PROVIDER = provider.lower()
+    
+    errors = Config.validate()
+    if errors:
+        for error in errors:
+            print_error(error)
+        sys.exit(1)
+    
+    try:
+        job = BatchJob.load(job_file)
+    except (ValueError, json.JSONDecodeError) as e:
+        print_error(f"Invalid job spec: {e}")
+        sys.exit(1)
+    
+    if state_dir is None:
+        state_dir = (
+            Path(".dev-standup-batch")
+            / f"{job_file.stem}-{date.today().isoformat()}-{job.fingerprint()}"
+        )
+    
+    print_info(
+        f"{len(job.repos)} repos x {len(job.people)} people x {len(job.moods)} moods "
+        f"| state: {state_dir}"
+    )
+    
+    runner = BatchRunner(
+        job,
+        state_dir,
+        scan_workers=scan_workers,
+        llm_workers=llm_workers,
+        retries=retries
+    )
+    stats = runner.run()
+    
+    print(stats.format())
+    print_success(f"Report written to {state_dir / 'report.md'}")
+    
+    if stats.units_failed:
+        print_warning(f"{stats.units_failed} units incomplete - re-run to resume")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,17 +4,28 @@ CLI interface for dev-standup with GitHub URL support.
 
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 import tempfile
 import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import click
 from colorama import init, Fore, Style, Back
 
 from dev_standup.config import Config
 from dev_standup.git_scanner import GitScanner
-from dev_standup.summarizer import create_summarizer
+from dev_standup.summarizer import create_summarizers, preload_model, summarize_moods
+from dev_standup.pipeline import RepoSummary, ScanSummarizePipeline
+from dev_standup.output import OUTPUT_FORMATS, RENDERERS
+from dev_standup.rollup import (
+    ROLLUP_PERIODS,
+    SummaryStore,
+    build_rollup,
+    rollup_hours,
+    summary_variant,
+)
 from dev_standup.github_utils import is_github_url, normalize_github_url, clone_repository
 
 # Initialize colorama for Windows support
@@ -37,34 +48,44 @@ BANNER = f"""{Fore.CYAN}{Style.BRIGHT}
 """
 
 
+# Progress output goes here. --format markdown/json moves it to stderr so
+# stdout carries only the document.
+_progress_stream = None
+
+
+def progress_stream():
+    """Stream for progress output: stdout, or stderr while printing a document."""
+    return _progress_stream or sys.stdout
+
+
 def print_banner():
     """Print the ASCII art banner."""
-    print(BANNER)
+    print(BANNER, file=progress_stream())
 
 
 def print_header(text: str, color: str = Fore.CYAN):
     """Print a colored header with box."""
     width = 71
-    print(f"\n{color}{Style.BRIGHT}╔{'═' * width}╗")
+    print(f"\n{color}{Style.BRIGHT}╔{'═' * width}╗", file=progress_stream())
     padding = (width - len(text) - 2) // 2
-    print(f"║{' ' * padding} {text} {' ' * (width - len(text) - padding - 2)}║")
-    print(f"╚{'═' * width}╝{Style.RESET_ALL}")
+    print(f"║{' ' * padding} {text} {' ' * (width - len(text) - padding - 2)}║", file=progress_stream())
+    print(f"╚{'═' * width}╝{Style.RESET_ALL}", file=progress_stream())
 
 
 def print_box(text: str, color: str = Fore.WHITE):
     """Print text in a box."""
     width = 69
     lines = text.split('\n')
-    print(f"{color}┌{'─' * width}┐")
+    print(f"{color}┌{'─' * width}┐", file=progress_stream())
     for line in lines:
         padding = width - len(line)
-        print(f"│ {line}{' ' * (padding - 1)}│")
-    print(f"└{'─' * width}┘{Style.RESET_ALL}")
+        print(f"│ {line}{' ' * (padding - 1)}│", file=progress_stream())
+    print(f"└{'─' * width}┘{Style.RESET_ALL}", file=progress_stream())
 
 
 def print_success(text: str):
     """Print success message."""
-    print(f"{Fore.GREEN}{Style.BRIGHT}✔{Style.RESET_ALL} {Fore.GREEN}{text}{Style.RESET_ALL}")
+    print(f"{Fore.GREEN}{Style.BRIGHT}✔{Style.RESET_ALL} {Fore.GREEN}{text}{Style.RESET_ALL}", file=progress_stream())
 
 
 def print_error(text: str):
@@ -74,17 +95,17 @@ def print_error(text: str):
 
 def print_warning(text: str):
     """Print warning message."""
-    print(f"{Fore.YELLOW}{Style.BRIGHT}⚠{Style.RESET_ALL} {Fore.YELLOW}{text}{Style.RESET_ALL}")
+    print(f"{Fore.YELLOW}{Style.BRIGHT}⚠{Style.RESET_ALL} {Fore.YELLOW}{text}{Style.RESET_ALL}", file=progress_stream())
 
 
 def print_info(text: str):
     """Print info message."""
-    print(f"{Fore.BLUE}{Style.BRIGHT}ℹ{Style.RESET_ALL} {Fore.BLUE}{text}{Style.RESET_ALL}")
+    print(f"{Fore.BLUE}{Style.BRIGHT}ℹ{Style.RESET_ALL} {Fore.BLUE}{text}{Style.RESET_ALL}", file=progress_stream())
 
 
 def print_step(step_num: int, total: int, text: str):
     """Print a step indicator."""
-    print(f"{Fore.CYAN}{Style.BRIGHT}[{step_num}/{total}]{Style.RESET_ALL} {text}")
+    print(f"{Fore.CYAN}{Style.BRIGHT}[{step_num}/{total}]{Style.RESET_ALL} {text}", file=progress_stream())
 
 
 def print_spinner(text: str, duration: float = 0.5):
@@ -94,19 +115,113 @@ def print_spinner(text: str, duration: float = 0.5):
     i = 0
     while time.time() < end_time:
         frame = frames[i % len(frames)]
-        print(f'\r{Fore.CYAN}{frame}{Style.RESET_ALL} {text}', end='', flush=True)
+        print(f'\r{Fore.CYAN}{frame}{Style.RESET_ALL} {text}', end='', flush=True, file=progress_stream())
         time.sleep(0.1)
         i += 1
-    print(f'\r{Fore.GREEN}✔{Style.RESET_ALL} {text}')
+    print(f'\r{Fore.GREEN}✔{Style.RESET_ALL} {text}', file=progress_stream())
+
+
+
+def print_timeline(scanner: GitScanner, repo_paths: List[Path]):
+    """Stream a merged, most-recent-first commit timeline across repositories."""
+    print_header("TIMELINE", Fore.MAGENTA)
+    
+    current_day = None
+    count = 0
+    for commit in scanner.iter_timeline(repo_paths):
+        day = commit.timestamp.strftime("%A %Y-%m-%d")
+        if day != current_day:
+            print(f"\n{Fore.CYAN}{Style.BRIGHT}{day}{Style.RESET_ALL}")
+            current_day = day
+        subject = commit.message.splitlines()[0] if commit.message else ""
+        print(
+            f"  {commit.timestamp:%H:%M}  {Fore.YELLOW}{commit.repo_name:<20.20}{Style.RESET_ALL} "
+            f"{Fore.WHITE}{commit.sha}{Style.RESET_ALL}  {subject}"
+        )
+        count += 1
+    
+    if not count:
+        print_warning("No commits found in the selected time range")
+    else:
+        print(f"\n{Fore.GREEN}{Style.BRIGHT}{count} commits{Style.RESET_ALL}\n")
+
 
+def print_summaries(result: RepoSummary, show_repo: bool):
+    """Print one repository's summaries, labelled by mood when there are several."""
+    if show_repo:
+        print(f"\n{Fore.CYAN}{Style.BRIGHT}┌─ Repository: {result.repo_name}")
+        print(f"└{'─' * 69}{Style.RESET_ALL}")
+    
+    for mood, summary in result.summaries.items():
+        if len(result.summaries) > 1:
+            print(f"\n{Fore.MAGENTA}{Style.BRIGHT}[{mood.upper()}]{Style.RESET_ALL}")
+        print(f"\n{Fore.WHITE}{summary}{Style.RESET_ALL}\n")
+
+
+def print_rollup(scanner: GitScanner, summarizers: dict, repo_paths: List[Path], period: str) -> int:
+    """
+    Print a by-day rollup, summarizing only days missing from the summary store.
+    
+    Returns:
+        Number of repositories with commits in the window
+    """
+    days = ROLLUP_PERIODS[period]
+    store = SummaryStore()
+    print_header(f"{period.upper()} ROLLUP", Fore.MAGENTA)
+    
+    found = fresh = reused = 0
+    for repo_path in repo_paths:
+        commits = scanner.scan_repository(repo_path)
+        if not commits:
+            continue
+        found += 1
+        
+        if len(repo_paths) > 1:
+            print(f"\n{Fore.CYAN}{Style.BRIGHT}┌─ Repository: {repo_path.name}")
+            print(f"└{'─' * 69}{Style.RESET_ALL}")
+        
+        for mood, summarizer in summarizers.items():
+            variant = summary_variant(mood, scanner)
+            try:
+                dailies = build_rollup(repo_path, commits, summarizer, store, variant, days)
+            except Exception as e:
+                print_error(f"Failed to summarize {repo_path.name} ({mood}): {e}")
+                continue
+            
+            if len(summarizers) > 1:
+                print(f"\n{Fore.MAGENTA}{Style.BRIGHT}[{mood.upper()}]{Style.RESET_ALL}")
+            for daily in dailies:
+                source = "stored" if daily.reused else "new"
+                print(
+                    f"\n{Fore.CYAN}{Style.BRIGHT}{daily.day:%A %Y-%m-%d}{Style.RESET_ALL} "
+                    f"({len(daily.commits)} commits, {source})"
+                )
+                print(f"{Fore.WHITE}{daily.summary}{Style.RESET_ALL}")
+                if daily.reused:
+                    reused += 1
+                else:
+                    fresh += 1
+    
+    if found:
+        print()
+        print_info(f"{fresh} day(s) summarized, {reused} reused from {store.root}")
+    return found
 
 
 @click.command()
 @click.option(
     "--mood",
+    "moods",
     type=click.Choice(["neutral", "roast", "hero"], case_sensitive=False),
-    default=None,
-    help="Mood for the summary (neutral, roast, or hero)"
+    multiple=True,
+    help="Mood for the summary (neutral, roast, or hero); repeat for several moods from one scan"
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS, case_sensitive=False),
+    default="text",
+    help="Output format; markdown and json print only the document on stdout"
 )
 @click.option(
     "--hours",
@@ -127,22 +242,73 @@ def print_spinner(text: str, duration: float = 0.5):
 )
 @click.option(
     "--provider",
-    type=click.Choice(["openai", "ollama"], case_sensitive=False),
+    type=click.Choice(["openai", "ollama", "extractive"], case_sensitive=False),
     default=None,
     help="LLM provider to use (overrides .env setting)"
 )
+@click.option(
+    "--fallback",
+    type=str,
+    default=None,
+    help="Comma-separated providers to fail over to, e.g. 'openai,extractive'"
+)
+@click.option(
+    "--hedge-after",
+    type=float,
+    default=None,
+    help="Seconds without a first token before also trying the next provider"
+)
 @click.option(
     "--all-authors",
     is_flag=True,
     help="Include commits from all authors (default: only your commits)"
 )
+@click.option(
+    "--path",
+    "paths",
+    multiple=True,
+    help=(
+        "Only include commits touching this path or glob (repeatable), e.g. services/payments/. "
+        "Globs start at the repository root: '*.py' matches top-level files only, "
+        "'**/*.py' matches any depth"
+    )
+)
+@click.option(
+    "--timeline",
+    is_flag=True,
+    help="Print one chronological commit timeline across repositories instead of AI summaries"
+)
+@click.option(
+    "--rollup",
+    type=click.Choice(list(ROLLUP_PERIODS), case_sensitive=False),
+    default=None,
+    help="Summarize the last week or sprint day by day, reusing stored daily summaries"
+)
+@click.option(
+    "--diff-context",
+    is_flag=True,
+    help="Include a size-capped outline of each commit's diff in the prompt"
+)
+@click.option(
+    "--pack",
+    is_flag=True,
+    help="With --all-repos, summarize small repositories together in shared LLM requests"
+)
 def main(
-    mood: Optional[str],
+    moods: Tuple[str, ...],
+    output_format: str,
     hours: Optional[int],
     all_repos: bool,
     repo: Optional[str],
     provider: Optional[str],
-    all_authors: bool
+    fallback: Optional[str],
+    hedge_after: Optional[float],
+    all_authors: bool,
+    paths: Tuple[str, ...],
+    timeline: bool,
+    rollup: Optional[str],
+    diff_context: bool,
+    pack: bool
 ):
     """
     Dev-Standup: Generate AI-powered standup summaries from git commits.
@@ -156,13 +322,31 @@ def main(
         
         dev-standup --mood roast                       # Sarcastic summary
         
+        dev-standup --mood neutral --mood hero         # Two moods, one scan
+        
+        dev-standup --all-repos --format markdown      # Paste-ready markdown
+        
         dev-standup --repo https://github.com/user/repo  # Clone and scan GitHub repo
         
         dev-standup --hours 48 --all-authors          # Last 48 hours, all users
         
         dev-standup --all-repos                        # All repos in workspace
+        
+        dev-standup --all-repos --pack                 # Fewer LLM calls for many small repos
+        
+        dev-standup --all-repos --timeline             # "My day" across every repo
+        
+        dev-standup --path services/payments/          # Only part of a monorepo
+        
+        dev-standup --all-repos --rollup week          # Weekly report, one section per day
     """
     
+    # Keep stdout for the document itself; progress output goes to stderr
+    global _progress_stream
+    output_format = output_format.lower()
+    document_format = output_format if output_format != "text" else None
+    _progress_stream = sys.stderr if document_format else None
+    
     # Show banner
     print_banner()
     
@@ -170,24 +354,41 @@ def main(
     if provider:
         Config.LLM_PROVIDER = provider.lower()
     
-    if mood is None:
-        mood = Config.DEFAULT_MOOD
+    if fallback is not None:
+        Config.LLM_FALLBACK = fallback.lower()
+    
+    if hedge_after is not None:
+        Config.HEDGE_AFTER = hedge_after
+    
+    moods = list(dict.fromkeys(mood.lower() for mood in moods)) or [Config.DEFAULT_MOOD]
     
-    if hours is None:
+    if rollup:
+        rollup = rollup.lower()
+        hours = rollup_hours(ROLLUP_PERIODS[rollup])
+    elif hours is None:
         hours = Config.DEFAULT_HOURS
     
     # Validate configuration
     print_step(1, 4, "Validating configuration...")
     errors = Config.validate()
+    if output_format != "text" and (timeline or rollup):
+        errors.append(f"--format {output_format} is not supported with --timeline or --rollup")
     if errors:
         for error in errors:
             print_error(error)
         sys.exit(1)
     print_success("Configuration valid")
     
+    # Load the model in the background while git is being scanned. The
+    # timeline never calls the LLM, so it must not load a model either.
+    if not timeline:
+        threading.Thread(target=preload_model, daemon=True).start()
+    
     # Handle GitHub URL or local path
     scan_path = None
     cleanup_temp_dir = False
+    scanner = None
+    results: List[RepoSummary] = []
     
     print_step(2, 4, "Preparing repository...")
     
@@ -219,12 +420,33 @@ def main(
     try:
         # Initialize scanner
         print_step(3, 4, "Scanning git commits...")
-        scanner = GitScanner(hours=hours, all_authors=all_authors)
+        scanner = GitScanner(
+            hours=hours,
+            all_authors=all_authors,
+            diff_context=diff_context,
+            paths=list(paths)
+        )
+        
+        if timeline:
+            print_timeline(scanner, scanner.find_repositories(scan_path) if all_repos else [scan_path])
+            return
         
         # Scan repositories
+        repo_paths = None
         if all_repos:
             print_spinner(f"Discovering repositories in {scan_path.name}", 0.5)
-            repos_commits = scanner.scan_multiple_repositories(search_root=scan_path)
+            repo_paths = scanner.find_repositories(scan_path)
+            
+            if not repo_paths:
+                print_warning("No git repositories found")
+                print_info("Try: Run from a directory that contains git repositories")
+                return
+            
+            print_success(f"Found {len(repo_paths)} repositories!")
+        
+        if all_repos and pack:
+            # Packing needs every repository's commits before the first request
+            repos_commits = scanner.scan_multiple_repositories(repo_paths=repo_paths)
             
             if not repos_commits:
                 print_warning(f"No git repositories with recent commits found")
@@ -232,6 +454,13 @@ def main(
                 return
             
             print_success(f"Found {len(repos_commits)} repositories with commits!")
+        elif rollup:
+            # Scanned per repository by the rollup below
+            repos_commits = None
+            repo_paths = repo_paths or [scan_path]
+        elif all_repos:
+            # Scanned lazily by the pipeline below, overlapping with the LLM
+            repos_commits = None
         else:
             # Scan single repository
             print_spinner(f"Analyzing commits in {scan_path.name}", 0.5)
@@ -239,12 +468,13 @@ def main(
             
             if not commits:
                 print_warning(f"No commits found in the last {hours} hours")
-                print("\n" + "─" * 71)
+                out = progress_stream()
+                print("\n" + "─" * 71, file=out)
                 print_info("Tips:")
-                print(f"   • Try: {Fore.CYAN}--hours 48{Style.RESET_ALL} for longer range")
-                print(f"   • Try: {Fore.CYAN}--all-authors{Style.RESET_ALL} to include everyone")
-                print(f"   • Try: {Fore.CYAN}--all-repos{Style.RESET_ALL} to scan workspace")
-                print("─" * 71)
+                print(f"   • Try: {Fore.CYAN}--hours 48{Style.RESET_ALL} for longer range", file=out)
+                print(f"   • Try: {Fore.CYAN}--all-authors{Style.RESET_ALL} to include everyone", file=out)
+                print(f"   • Try: {Fore.CYAN}--all-repos{Style.RESET_ALL} to scan workspace", file=out)
+                print("─" * 71, file=out)
                 return
             
             repos_commits = {scan_path.name: commits}
@@ -253,35 +483,99 @@ def main(
         # Initialize summarizer
         print_step(4, 4, "Generating AI summary...")
         
-        print_info(f"Provider: {Config.LLM_PROVIDER.upper()} | Mode: {mood.upper()}")
+        providers = " → ".join(name.upper() for name in Config.provider_chain())
+        print_info(f"Provider: {providers} | Mode: {', '.join(m.upper() for m in moods)}")
         
         try:
-            summarizer = create_summarizer(mood=mood)
-            print_success("AI ready!")
+            summarizers = create_summarizers(moods)
         except Exception as e:
             print_error(f"Failed to initialize LLM: {e}")
             sys.exit(1)
         
-        # Generate summaries for each repository
-        print_header("STANDUP SUMMARY", Fore.MAGENTA)
+        if any(s.health_check() for s in summarizers.values()):
+            print_success("AI ready!")
+        else:
+            print_warning("LLM provider is not responding - summaries will likely fail")
         
-        for repo_name, commits in repos_commits.items():
-            if len(repos_commits) > 1:
-                print(f"\n{Fore.CYAN}{Style.BRIGHT}┌─ Repository: {repo_name}")
-                print(f"└{'─' * 69}{Style.RESET_ALL}")
+        if rollup:
+            if not print_rollup(scanner, summarizers, repo_paths, rollup):
+                print_warning(f"No commits found in the last {ROLLUP_PERIODS[rollup]} days")
+                return
+        elif repos_commits is None:
+            # Summaries are printed as soon as each repository is scanned and summarized
+            if output_format == "text":
+                print_header("STANDUP SUMMARY", Fore.MAGENTA)
             
-            print_spinner("Processing with AI", 1.0)
-            summary = summarizer.summarize(commits)
+            pipeline = ScanSummarizePipeline(scanner, summarizers)
+            for result in pipeline.run(repo_paths):
+                results.append(result)
+                if output_format == "text":
+                    print_summaries(result, show_repo=True)
             
-            # Print summary in a box
-            print(f"\n{Fore.WHITE}{summary}{Style.RESET_ALL}\n")
+            if not results:
+                print_warning("No git repositories with recent commits found")
+                print_info("Try: Increase time range with --hours or check git repositories")
+                return
+            
+            # Results arrive in completion order; documents use discovery order
+            position = {path.name: i for i, path in enumerate(repo_paths)}
+            results.sort(key=lambda result: position.get(result.repo_name, len(position)))
+        else:
+            # Pack small repositories into shared requests up front, all moods at once
+            packed_summaries = {}
+            if pack and len(repos_commits) > 1:
+                # A plain status line: a timed spinner would add a fixed delay
+                print_info(f"Packing {len(repos_commits)} repositories into shared AI requests...")
+                with ThreadPoolExecutor(len(summarizers), thread_name_prefix="mood") as pool:
+                    packed_summaries = dict(zip(summarizers, pool.map(
+                        lambda summarizer: summarizer.summarize_packed(repos_commits),
+                        summarizers.values()
+                    )))
+            
+            # Generate summaries for each repository
+            if output_format == "text":
+                print_header("STANDUP SUMMARY", Fore.MAGENTA)
+            
+            for repo_name, commits in repos_commits.items():
+                missing = {
+                    mood: summarizer for mood, summarizer in summarizers.items()
+                    if repo_name not in packed_summaries.get(mood, {})
+                }
+                if missing and output_format == "text":
+                    print_spinner("Processing with AI", 1.0)
+                fresh = summarize_moods(missing, commits) if missing else {}
+                
+                summaries = {
+                    mood: fresh[mood] if mood in fresh else packed_summaries[mood][repo_name]
+                    for mood in summarizers
+                }
+                result = RepoSummary(repo_name, commits, summaries)
+                results.append(result)
+                if output_format == "text":
+                    print_summaries(result, show_repo=len(repos_commits) > 1)
+        
+        if document_format:
+            return
         
         # Footer
         print(f"\n{Fore.GREEN}{Style.BRIGHT}{'═' * 71}")
         print(f"{'Ready for standup! Good luck!':^71}")
         print(f"{'═' * 71}{Style.RESET_ALL}\n")
     
+    except BaseException:
+        # A failed run prints no document, just the error and a non-zero exit
+        document_format = None
+        raise
     finally:
+        # Every successful run prints exactly one document, even when no
+        # commits were found (an empty "repositories" list / just the title)
+        if document_format:
+            print(RENDERERS[document_format](results, moods, hours))
+        
+        # Stop pooled git helper processes before removing a cloned repo
+        if scanner is not None:
+            scanner.close()
+        
         # Cleanup temporary directory if we cloned a repo
         if cleanup_temp_dir and scan_path and scan_path.exists():
             try:
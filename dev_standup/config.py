@@ -17,6 +17,25 @@ class Config:
     
     # LLM Provider
     LLM_PROVIDER = os.getenv("LLM_PROVIDER", "ollama").lower()
+    # Comma-separated providers to fail over to, in order (e.g. "openai,extractive")
+    LLM_FALLBACK = os.getenv("LLM_FALLBACK", "").lower()
+    # Seconds without a first token before a fallback is raced against the primary (0 = off)
+    HEDGE_AFTER = float(os.getenv("HEDGE_AFTER", "0"))
+    
+    # Timeouts (seconds) and circuit breaker
+    CONNECT_TIMEOUT = float(os.getenv("CONNECT_TIMEOUT", "2"))
+    LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "60"))
+    HEALTH_TIMEOUT = float(os.getenv("HEALTH_TIMEOUT", "1"))
+    CIRCUIT_FAILURES = int(os.getenv("CIRCUIT_FAILURES", "3"))
+    CIRCUIT_RESET_SECONDS = float(os.getenv("CIRCUIT_RESET_SECONDS", "30"))
+    
+    # LLM Transport: "live", "record" (save to cassette) or "replay" (offline)
+    LLM_TRANSPORT = os.getenv("LLM_TRANSPORT", "live").lower()
+    LLM_CASSETTE = os.getenv("LLM_CASSETTE", ".dev-standup-cassette.jsonl")
+    # Simulated timing for replay (seconds, tokens/second; 0 = instant)
+    REPLAY_LATENCY = float(os.getenv("REPLAY_LATENCY", "0"))
+    REPLAY_TTFT = float(os.getenv("REPLAY_TTFT", "0"))
+    REPLAY_TOKENS_PER_SEC = float(os.getenv("REPLAY_TOKENS_PER_SEC", "0"))
     
     # OpenAI Configuration
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
@@ -25,11 +44,67 @@ class Config:
     # Ollama Configuration
     OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
     OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama2")
+    # How long Ollama keeps the model loaded after a request ("30m"; bare numbers
+    # are seconds, "-1" = forever)
+    OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
     
     # Default Settings
     DEFAULT_MOOD = os.getenv("DEFAULT_MOOD", "neutral")
     DEFAULT_HOURS = int(os.getenv("DEFAULT_HOURS", "24"))
     
+    # Diff Context (--diff-context), in bytes of condensed diff text per commit
+    # and per repository
+    DIFF_BYTES_PER_COMMIT = int(os.getenv("DIFF_BYTES_PER_COMMIT", "1500"))
+    DIFF_BYTES_TOTAL = int(os.getenv("DIFF_BYTES_TOTAL", "12000"))
+    
+    # Request Packing (--pack)
+    PACK_TOKEN_BUDGET = int(os.getenv("PACK_TOKEN_BUDGET", "1500"))
+    PACK_MAX_REPOS = int(os.getenv("PACK_MAX_REPOS", "8"))
+    
+    # Pipelined --all-repos (scan and summarize concurrently)
+    PIPELINE_SCAN_WORKERS = int(os.getenv("PIPELINE_SCAN_WORKERS", "2"))
+    PIPELINE_LLM_WORKERS = int(os.getenv("PIPELINE_LLM_WORKERS", "1"))
+    PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "4"))
+    
+    # Batch Runner
+    BATCH_SCAN_WORKERS = int(os.getenv("BATCH_SCAN_WORKERS", "4"))
+    BATCH_LLM_WORKERS = int(os.getenv("BATCH_LLM_WORKERS", "2"))
+    
+    # Rollups (--rollup): stored daily summaries and sprint length in days
+    SUMMARY_STORE_DIR = os.getenv("SUMMARY_STORE_DIR", "~/.dev-standup/summaries")
+    SPRINT_DAYS = int(os.getenv("SPRINT_DAYS", "14"))
+    
+    # Live GitPython Repo handles (each keeps git helper processes running)
+    GIT_MAX_OPEN_REPOS = int(os.getenv("GIT_MAX_OPEN_REPOS", "16"))
+    
+    @classmethod
+    def provider_chain(cls) -> list[str]:
+        """
+        Providers to use, primary first, without duplicates.
+        
+        Returns:
+            List of provider names
+        """
+        names = [cls.LLM_PROVIDER] + [n.strip() for n in cls.LLM_FALLBACK.split(",")]
+        return list(dict.fromkeys(n for n in names if n))
+    
+    @classmethod
+    def model_chain(cls) -> list[str]:
+        """
+        Provider chain with model names, e.g. ["ollama:llama2", "extractive"].
+        
+        Anything that changes which model writes a summary changes this list,
+        so it can be used to tell stored summaries apart.
+        
+        Returns:
+            List of provider (and model) identifiers, primary first
+        """
+        models = {"openai": cls.OPENAI_MODEL, "ollama": cls.OLLAMA_MODEL}
+        return [
+            f"{name}:{models[name]}" if name in models else name
+            for name in cls.provider_chain()
+        ]
+    
     @classmethod
     def validate(cls) -> list[str]:
         """
@@ -40,16 +115,27 @@ class Config:
         """
         errors = []
         
-        if cls.LLM_PROVIDER == "openai" and not cls.OPENAI_API_KEY:
+        providers = cls.provider_chain()
+        
+        if "openai" in providers and not cls.OPENAI_API_KEY and cls.LLM_TRANSPORT != "replay":
             errors.append(
                 "OpenAI API key not found. Set OPENAI_API_KEY in .env file "
                 "or switch to Ollama by setting LLM_PROVIDER=ollama"
             )
         
-        if cls.LLM_PROVIDER not in ["openai", "ollama"]:
+        for provider in providers:
+            if provider not in ["openai", "ollama", "extractive"]:
+                errors.append(
+                    f"Invalid LLM provider: {provider}. "
+                    "Must be 'openai', 'ollama' or 'extractive'"
+                )
+        
+        if cls.LLM_TRANSPORT not in ["live", "record", "replay"]:
             errors.append(
-                f"Invalid LLM_PROVIDER: {cls.LLM_PROVIDER}. "
-                "Must be 'openai' or 'ollama'"
+                f"Invalid LLM_TRANSPORT: {cls.LLM_TRANSPORT}. "
+                "Must be 'live', 'record' or 'replay'"
             )
+        elif cls.LLM_TRANSPORT == "replay" and not Path(cls.LLM_CASSETTE).exists():
+            errors.append(f"Replay cassette not found: {cls.LLM_CASSETTE}")
         
         return errors
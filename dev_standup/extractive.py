@@ -0,0 +1,331 @@
+"""
+Offline extractive summaries built directly from commit metadata.
+
+No model and no network: commits are parsed for conventional-commit prefixes
+and ticket IDs, clustered by the area of the tree they touch, ranked by churn,
+and rendered through per-mood templates. Output is deterministic and runs in
+linear time over the commits.
+"""
+
+import re
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from dev_standup.git_scanner import CommitInfo, is_noise_path
+
+# Maximum number of bullet points, matching the LLM prompts' "3-7 bullets" rule
+MAX_BULLETS = 7
+
+# Descriptions and tickets quoted per bullet before collapsing into "+N more"
+MAX_DESCRIPTIONS = 3
+MAX_TICKETS = 3
+
+CONVENTIONAL_RE = re.compile(r"^(?P<type>[a-zA-Z]+)(?:\((?P<scope>[^)]*)\))?(?P<breaking>!)?:\s*(?P<desc>.+)")
+# Standards and algorithms shaped like ticket keys ("UTF-8", "SHA-256")
+NOT_TICKET_KEYS = [
+    "AES", "ANSI", "CRC", "CVE", "ECMA", "IEC", "IEEE", "ISO", "PEP", "RFC", "SHA", "UCS", "UTF",
+]
+# Ticket keys start with at least two letters, e.g. "PAY-123"; GitHub issues are "#123"
+TICKET_RE = re.compile(
+    r"\b(?!(?:" + "|".join(NOT_TICKET_KEYS) + r")-)[A-Z]{2,}[A-Z0-9]*-\d+\b|(?<![\w/])#\d+\b"
+)
+VAGUE_RE = re.compile(r"^(wip|fix(es|ed)?|update[sd]?|changes?|stuff|misc|tmp|test|\.+)$", re.IGNORECASE)
+
+TYPE_VERBS = {
+    "feat": "Added",
+    "fix": "Fixed",
+    "docs": "Documented",
+    "refactor": "Refactored",
+    "perf": "Sped up",
+    "test": "Tested",
+    "style": "Tidied",
+    "build": "Maintained",
+    "ci": "Maintained",
+    "chore": "Maintained",
+    "revert": "Reverted",
+}
+
+# Imperative verbs commit subjects tend to start with, and their past tense.
+# A description that already has one keeps it instead of getting a type verb.
+PAST_TENSE = {
+    "add": "Added", "fix": "Fixed", "update": "Updated", "remove": "Removed",
+    "delete": "Deleted", "implement": "Implemented", "refactor": "Refactored",
+    "improve": "Improved", "rename": "Renamed", "move": "Moved", "bump": "Bumped",
+    "upgrade": "Upgraded", "drop": "Dropped", "handle": "Handled", "support": "Supported",
+    "create": "Created", "introduce": "Introduced", "document": "Documented",
+    "change": "Changed", "replace": "Replaced", "allow": "Allowed", "enable": "Enabled",
+    "disable": "Disabled", "revert": "Reverted", "optimize": "Optimized",
+    "simplify": "Simplified", "extract": "Extracted", "migrate": "Migrated",
+}
+VERB_FORMS = {
+    form: past
+    for base, past in PAST_TENSE.items()
+    for form in (base, base + "s", base + "es", base + "d", past.lower())
+}
+
+MOOD_TEMPLATES = {
+    "neutral": [
+        "• {verb} {what} in {area}{tickets}",
+    ],
+    "roast": [
+        "• {verb} {what} in {area}{tickets} 🙃 {churn} lines later, we'll see if it sticks",
+        "• {area} got {count} commit(s) of '{what}'{tickets}. Bold strategy 😏",
+        "• {verb} {what} in {area}{tickets}. Surely no follow-up fix needed 🤡",
+    ],
+    "hero": [
+        "• ⚔️ {verb} {what} in the realm of {area}{tickets}!",
+        "• 🛡️ Across {count} mighty commit(s), {area} was defended: {what}{tickets}",
+        "• 🏆 Legend tells how {area} was transformed ({churn} lines): {what}{tickets}",
+    ],
+}
+
+ROAST_EXTRAS = {
+    "vague": "• {count} commit message(s) as descriptive as '{example}'. Truly a poet 📝",
+    "late": "• {count} commit(s) after 10pm. Sleep is for people without merge conflicts 🌙",
+}
+
+HERO_EXTRAS = {
+    "fixes": "• 🔥 {count} bug-monster(s) slain this day!",
+}
+
+
+@dataclass
+class ParsedCommit:
+    """Commit fields extracted for ranking and rendering."""
+    commit: CommitInfo
+    type: str
+    scope: str
+    description: str
+    tickets: List[str]
+    churn: int
+
+
+@dataclass
+class Cluster:
+    """Commits that touched the same area of the tree."""
+    area: str
+    commits: List[ParsedCommit] = field(default_factory=list)
+    
+    @property
+    def churn(self) -> int:
+        return sum(c.churn for c in self.commits)
+
+
+def parse_commit(commit: CommitInfo) -> ParsedCommit:
+    """
+    Extract type, scope, description and tickets from a commit.
+    
+    Args:
+        commit: Commit to parse
+    
+    Returns:
+        ParsedCommit with a best-effort type ("other" if not conventional)
+    """
+    subject = commit.message.splitlines()[0].strip() if commit.message else ""
+    match = CONVENTIONAL_RE.match(subject)
+    if match:
+        commit_type = match.group("type").lower()
+        scope = (match.group("scope") or "").strip()
+        description = match.group("desc").strip()
+    else:
+        commit_type = "other"
+        scope = ""
+        description = subject
+    
+    tickets = list(dict.fromkeys(TICKET_RE.findall(commit.message)))
+    # Tickets are listed separately, so drop them from the description
+    for ticket in tickets:
+        description = description.replace(ticket, "")
+    description = re.sub(r"\s+", " ", description).strip(" -:,;()[]") or subject
+    
+    return ParsedCommit(
+        commit=commit,
+        type=commit_type,
+        scope=scope,
+        description=description,
+        tickets=tickets,
+        churn=commit.insertions + commit.deletions,
+    )
+
+
+def commit_area(parsed: ParsedCommit) -> str:
+    """
+    Pick the area a commit belongs to: its scope, else its busiest directory.
+    
+    Lock, generated and top-level files only count when the commit touched
+    nothing else, so "package-lock.json + src/api/a.py" lands in src/api.
+    
+    Args:
+        parsed: Parsed commit
+    
+    Returns:
+        Area label such as "payments" or "src/api"
+    """
+    if parsed.scope:
+        return parsed.scope
+    
+    directories = Counter()
+    fallback = Counter()
+    for path in parsed.commit.files_changed:
+        parts = path.split("/")[:-1]
+        if parts and not is_noise_path(path):
+            directories["/".join(parts[:2])] += 1
+        else:
+            fallback["/".join(parts[:2]) if parts else "root"] += 1
+    
+    directories = directories or fallback
+    if not directories:
+        return parsed.commit.repo_name or "root"
+    # Ties break alphabetically so output is stable
+    return min(directories.items(), key=lambda item: (-item[1], item[0]))[0]
+
+
+def cluster_commits(commits: List[CommitInfo]) -> List[Cluster]:
+    """
+    Group commits by area and rank the groups by churn.
+    
+    Args:
+        commits: Commits to cluster
+    
+    Returns:
+        Clusters, highest churn first
+    """
+    return _cluster_parsed([parse_commit(c) for c in commits])
+
+
+def _cluster_parsed(parsed_commits: List[ParsedCommit]) -> List[Cluster]:
+    clusters: Dict[str, Cluster] = {}
+    for parsed in parsed_commits:
+        area = commit_area(parsed)
+        clusters.setdefault(area, Cluster(area)).commits.append(parsed)
+    
+    return sorted(
+        clusters.values(),
+        key=lambda c: (-c.churn, -len(c.commits), c.area)
+    )
+
+
+def split_verb(description: str) -> Tuple[Optional[str], str]:
+    """
+    Split a leading imperative verb off a description.
+    
+    Args:
+        description: Commit description, e.g. "add retry to payments"
+    
+    Returns:
+        (past tense verb or None, rest of the description),
+        e.g. ("Added", "retry to payments")
+    """
+    first, _, rest = description.partition(" ")
+    past = VERB_FORMS.get(first.lower())
+    if past is None or not rest.strip():
+        return None, description
+    return past, rest.strip()
+
+
+def _lower_first(text: str) -> str:
+    """Lowercase a leading capital, leaving acronyms and names like "OAuth" alone."""
+    first = text.split(" ", 1)[0]
+    if first[1:] != first[1:].lower():
+        return text
+    return text[:1].lower() + text[1:]
+
+
+def _render_cluster(cluster: Cluster, mood: str) -> str:
+    types = Counter(c.type for c in cluster.commits)
+    dominant = min(types.items(), key=lambda item: (-item[1], item[0]))[0]
+    verb = TYPE_VERBS.get(dominant, "Worked on")
+    
+    ranked = sorted(cluster.commits, key=lambda c: -c.churn)
+    descriptions = list(dict.fromkeys(c.description for c in ranked))
+    
+    templates = MOOD_TEMPLATES.get(mood, MOOD_TEMPLATES["neutral"])
+    # Stable choice per area instead of random, so reruns are identical
+    template = templates[zlib.crc32(cluster.area.encode()) % len(templates)]
+    
+    # "feat: add X" reads "Added X", not "Added add X"; templates without a
+    # verb slot keep the description's own verb inline
+    parts = []
+    for i, description in enumerate(descriptions[:MAX_DESCRIPTIONS]):
+        past, rest = split_verb(description)
+        if past is None:
+            parts.append(description)
+        elif i == 0 and "{verb}" in template:
+            verb = past
+            parts.append(rest)
+        else:
+            parts.append(f"{past.lower()} {rest}")
+    
+    what = "; ".join(parts)
+    if len(descriptions) > MAX_DESCRIPTIONS:
+        what += f" (+{len(descriptions) - MAX_DESCRIPTIONS} more)"
+    if verb != "Worked on":
+        what = _lower_first(what)
+    
+    tickets = list(dict.fromkeys(t for c in ranked for t in c.tickets))
+    tickets_text = ""
+    if tickets:
+        tickets_text = ", ".join(tickets[:MAX_TICKETS])
+        if len(tickets) > MAX_TICKETS:
+            tickets_text += f" +{len(tickets) - MAX_TICKETS} more"
+        tickets_text = f" [{tickets_text}]"
+    
+    return template.format(
+        verb=verb,
+        what=what,
+        area=cluster.area,
+        tickets=tickets_text,
+        count=len(cluster.commits),
+        churn=cluster.churn,
+    )
+
+
+def _mood_extras(parsed_commits: List[ParsedCommit], mood: str) -> List[str]:
+    extras = []
+    if mood == "roast":
+        vague = [p.commit for p in parsed_commits if VAGUE_RE.match(p.commit.message.strip())]
+        if vague:
+            extras.append(ROAST_EXTRAS["vague"].format(
+                count=len(vague), example=vague[0].message.strip()
+            ))
+        late = [p for p in parsed_commits if p.commit.timestamp.hour >= 22 or p.commit.timestamp.hour < 5]
+        if late:
+            extras.append(ROAST_EXTRAS["late"].format(count=len(late)))
+    elif mood == "hero":
+        fixes = sum(1 for p in parsed_commits if p.type == "fix")
+        if fixes:
+            extras.append(HERO_EXTRAS["fixes"].format(count=fixes))
+    return extras
+
+
+def extractive_summary(commits: List[CommitInfo], mood: str = "neutral", max_bullets: Optional[int] = None) -> str:
+    """
+    Build a bullet-point standup summary without an LLM.
+    
+    Args:
+        commits: Commits to summarize
+        mood: "neutral", "roast", or "hero"
+        max_bullets: Maximum number of bullets (default: MAX_BULLETS)
+    
+    Returns:
+        Summary text
+    """
+    if not commits:
+        return "No commits to summarize."
+    
+    mood = mood.lower()
+    max_bullets = max_bullets or MAX_BULLETS
+    
+    parsed_commits = [parse_commit(c) for c in commits]
+    extras = _mood_extras(parsed_commits, mood)
+    clusters = _cluster_parsed(parsed_commits)
+    room = max(1, max_bullets - len(extras))
+    
+    bullets = [_render_cluster(cluster, mood) for cluster in clusters[:room]]
+    if len(clusters) > room:
+        rest = clusters[room:]
+        bullets[-1] += f" (plus {sum(len(c.commits) for c in rest)} commits in {len(rest)} other areas)"
+    
+    return "\n".join(bullets + extras)
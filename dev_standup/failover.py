@@ -0,0 +1,282 @@
+"""
+Provider chains: health probes, circuit breakers, failover and hedging.
+
+A ProviderChain wraps several summarizers (e.g. Ollama, then OpenAI, then the
+offline extractive provider). Providers that fail their startup health probe,
+or keep failing, are skipped by a per-provider circuit breaker. With hedging
+enabled, if the current provider hasn't produced its first token within
+``hedge_after`` seconds the next provider is started as well, and whichever
+answers first wins.
+"""
+
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from dev_standup.config import Config
+from dev_standup.git_scanner import CommitInfo
+from dev_standup.summarizer import (
+    BaseSummarizer,
+    SummarizerError,
+    MAX_SUMMARY_TOKENS,
+)
+
+
+class CircuitBreaker:
+    """Stops calling a provider after repeated failures, then retries later."""
+    
+    def __init__(
+        self,
+        failure_threshold: int = Config.CIRCUIT_FAILURES,
+        reset_timeout: float = Config.CIRCUIT_RESET_SECONDS
+    ):
+        """
+        Initialize the breaker (closed).
+        
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds before an open circuit lets one trial call through
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """Return True if a call may be made now."""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            # Half-open: let a single trial call through
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+    
+    def record_success(self):
+        """Close the circuit."""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+    
+    def record_failure(self):
+        """Count a failure, opening the circuit at the threshold."""
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.failures >= self.failure_threshold or self.opened_at is not None:
+                self.opened_at = time.monotonic()
+    
+    def trip(self):
+        """Open the circuit immediately (e.g. after a failed health probe)."""
+        with self._lock:
+            self.failures = self.failure_threshold
+            self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+class ProviderChain(BaseSummarizer):
+    """Summarizer that fails over, and optionally hedges, across providers."""
+    
+    def __init__(
+        self,
+        mood: str,
+        providers: List[BaseSummarizer],
+        hedge_after: Optional[float] = None,
+        probe: bool = True,
+        breakers: Optional[Dict[str, CircuitBreaker]] = None
+    ):
+        """
+        Initialize the chain.
+        
+        Args:
+            mood: Mood for the summary
+            providers: Summarizers in order of preference
+            hedge_after: Seconds to wait for the current provider's first token
+                before also starting the next one (None disables hedging)
+            probe: Run health probes now and skip providers that fail them
+            breakers: Circuit breakers by provider name, to share provider
+                health with another chain (e.g. one chain per mood)
+        """
+        super().__init__(mood)
+        self.providers = providers
+        self.hedge_after = hedge_after
+        self.breakers: Dict[str, CircuitBreaker] = breakers if breakers is not None else {}
+        for name in self.names:
+            self.breakers.setdefault(name, CircuitBreaker())
+        if probe:
+            self.probe()
+    
+    @property
+    def names(self) -> List[str]:
+        """Provider names, in order of preference."""
+        return [self._name(p) for p in self.providers]
+    
+    @staticmethod
+    def _name(provider: BaseSummarizer) -> str:
+        return type(provider).__name__.replace("Summarizer", "").lower()
+    
+    def _breaker(self, provider: BaseSummarizer) -> CircuitBreaker:
+        return self.breakers[self._name(provider)]
+    
+    def probe(self) -> Dict[str, bool]:
+        """
+        Health-check every provider concurrently and trip unhealthy ones.
+        
+        Returns:
+            Dictionary mapping provider names to health
+        """
+        health: Dict[int, bool] = {}
+        
+        def check(provider: BaseSummarizer):
+            try:
+                health[id(provider)] = provider.health_check()
+            except Exception:
+                health[id(provider)] = False
+        
+        threads = [
+            threading.Thread(target=check, args=(p,), daemon=True)
+            for p in self.providers
+        ]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + Config.HEALTH_TIMEOUT + 0.5
+        for thread in threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        
+        for provider in self.providers:
+            if not health.get(id(provider), False):
+                self._breaker(provider).trip()
+        
+        return {
+            name: health.get(id(p), False)
+            for name, p in zip(self.names, self.providers)
+        }
+    
+    def health_check(self) -> bool:
+        """The chain is healthy if any provider's circuit is closed."""
+        return any(
+            self._breaker(p).opened_at is None for p in self.providers
+        )
+    
+    def warm_up(self) -> bool:
+        """Warm up every provider."""
+        return any([p.warm_up() for p in self.providers])
+    
+    def generate(
+        self,
+        commits: List[CommitInfo],
+        first_token: Optional[threading.Event] = None,
+        commits_text: Optional[str] = None
+    ) -> str:
+        """Summarize commits with the first provider that answers."""
+        return self._run(
+            lambda p, event: p.generate(commits, first_token=event, commits_text=commits_text),
+            first_token
+        )
+    
+    def complete(
+        self,
+        user_prompt: str,
+        max_tokens: int = MAX_SUMMARY_TOKENS,
+        first_token: Optional[threading.Event] = None
+    ) -> str:
+        """Send a prompt to the first provider that answers."""
+        return self._run(
+            lambda p, event: p.complete(user_prompt, max_tokens, first_token=event),
+            first_token
+        )
+    
+    def _run(
+        self,
+        call: Callable[[BaseSummarizer, threading.Event], str],
+        first_token: Optional[threading.Event]
+    ) -> str:
+        candidates = list(self.providers)
+        outcomes: queue.Queue = queue.Queue()
+        
+        def next_provider() -> Optional[BaseSummarizer]:
+            # allow() claims a half-open breaker's single trial slot, so it is
+            # only asked for the provider about to be started
+            while candidates:
+                provider = candidates.pop(0)
+                if self._breaker(provider).allow():
+                    return provider
+            return None
+        
+        def attempt(provider: BaseSummarizer, event: threading.Event):
+            # The outcome is recorded here rather than by the caller, so an
+            # abandoned hedge still releases its breaker's trial slot
+            breaker = self._breaker(provider)
+            try:
+                text = call(provider, event)
+            except Exception as e:
+                breaker.record_failure()
+                outcomes.put((provider, None, e))
+                return
+            breaker.record_success()
+            outcomes.put((provider, text, None))
+        
+        errors = []
+        started = 0
+        in_flight = 0
+        latest_started: Optional[threading.Event] = None
+        hedge_deadline = float("inf")
+        
+        while True:
+            # Start the next provider when nothing is running (failover), or
+            # when the newest attempt is still silent past the hedge deadline
+            stalled = (
+                latest_started is not None
+                and not latest_started.is_set()
+                and time.monotonic() >= hedge_deadline
+            )
+            provider = None
+            if candidates and (in_flight == 0 or stalled):
+                provider = next_provider()
+            if provider is None and started == 0:
+                # Everything is open; trying the primary beats failing outright
+                provider = self.providers[0]
+            if provider is not None:
+                latest_started = threading.Event()
+                # Losing attempts are abandoned, so never block exit on them
+                threading.Thread(
+                    target=attempt, args=(provider, latest_started), daemon=True
+                ).start()
+                started += 1
+                in_flight += 1
+                if self.hedge_after is not None:
+                    hedge_deadline = time.monotonic() + self.hedge_after
+            
+            if in_flight == 0:
+                raise SummarizerError(
+                    "All LLM providers failed: " + "; ".join(errors)
+                )
+            
+            timeout = None
+            if candidates and not latest_started.is_set() and hedge_deadline != float("inf"):
+                timeout = max(0.05, hedge_deadline - time.monotonic())
+            
+            try:
+                provider, text, error = outcomes.get(timeout=timeout)
+            except queue.Empty:
+                continue
+            
+            in_flight -= 1
+            if error is None:
+                if first_token is not None:
+                    first_token.set()
+                return text
+            errors.append(f"{type(provider).__name__}: {error}")
+    
+    def _describe_error(self, error: Exception) -> str:
+        """Report chain failures plainly."""
+        if isinstance(error, SummarizerError):
+            return f"Error: {error}"
+        return super()._describe_error(error)
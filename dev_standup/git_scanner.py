@@ -2,15 +2,51 @@
 Git repository scanning and commit extraction.
 """
 
+import heapq
 import os
+import re
+import subprocess
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from fnmatch import translate
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 from dataclasses import dataclass
 
 import git
 from git import Repo, Commit
 
+from dev_standup.config import Config
+
+# Files whose diffs carry no useful signal for a standup summary
+SKIPPED_DIFF_PATTERNS = [
+    "*.lock", "package-lock.json", "pnpm-lock.yaml", "go.sum", "npm-shrinkwrap.json",
+    "*.min.js", "*.min.css", "*.map", "*.svg",
+    "*_pb2.py", "*.pb.go", "*.generated.*", "*.g.dart",
+    "dist/*", "build/*", "vendor/*", "node_modules/*",
+]
+
+# SKIPPED_DIFF_PATTERNS as one regex, checked for every changed file
+NOISE_PATH_RE = re.compile("|".join(translate(pattern) for pattern in SKIPPED_DIFF_PATTERNS))
+
+# Changed lines that declare something (function, class, type, ...) are kept
+SYMBOL_LINE_RE = re.compile(
+    r"^[+-]\s*(?:export\s+|pub\s+|public\s+|private\s+|protected\s+|static\s+|async\s+)*"
+    r"(?:def|class|function|func|fn|interface|struct|enum|trait|impl|type|module)\s+\w"
+)
+
+# Longest line read from git in one go; longer lines (minified code) are cut
+MAX_DIFF_LINE = 4096
+
+# Raw diff bytes read per commit before giving up, however little was kept
+MAX_DIFF_SCAN_BYTES = 1024 * 1024
+
+# Newest commits considered per repository
+MAX_COMMITS_PER_REPO = 200
+
 
 @dataclass
 class CommitInfo:
@@ -21,22 +57,171 @@ class CommitInfo:
     timestamp: datetime
     files_changed: List[str]
     repo_name: str
+    author_email: str = ""
+    insertions: int = 0
+    deletions: int = 0
+    diff_context: str = ""
+
+
+class RepoPool:
+    """
+    Bounded pool of GitPython Repo handles.
+    
+    Every Repo keeps ``git cat-file`` helper processes (and their pipes)
+    alive until it is closed. The pool caps how many handles exist at once,
+    in use or idle, keeps idle ones for reuse in least-recently-used order,
+    and closes whatever it evicts, so child processes and file descriptors
+    stay bounded however many repositories are scanned.
+    """
+    
+    def __init__(self, max_open: int = Config.GIT_MAX_OPEN_REPOS):
+        """
+        Initialize the pool.
+        
+        Args:
+            max_open: Maximum number of live Repo handles
+        """
+        self.max_open = max(1, max_open)
+        self._idle: "OrderedDict[Path, List[Repo]]" = OrderedDict()
+        self._idle_count = 0
+        self._in_use = 0
+        self._cond = threading.Condition()
+    
+    @contextmanager
+    def repo(self, repo_path: Path) -> Iterator[Repo]:
+        """
+        Check out a handle for exclusive use by the calling thread.
+        
+        Blocks while ``max_open`` handles are in use. A handle whose user
+        raised is closed instead of being reused.
+        
+        Args:
+            repo_path: Path to the git repository
+            
+        Yields:
+            Repo for ``repo_path``
+        
+        Raises:
+            git.InvalidGitRepositoryError: If the path is not a repository
+        """
+        repo = self._acquire(repo_path)
+        try:
+            yield repo
+        except BaseException:
+            self._release(repo_path, repo, reuse=False)
+            raise
+        self._release(repo_path, repo, reuse=True)
+    
+    def _acquire(self, repo_path: Path) -> Repo:
+        evicted: List[Repo] = []
+        with self._cond:
+            while True:
+                handles = self._idle.get(repo_path)
+                if handles:
+                    repo = handles.pop()
+                    if not handles:
+                        del self._idle[repo_path]
+                    self._idle_count -= 1
+                    self._in_use += 1
+                    return repo
+                if self._in_use + self._idle_count < self.max_open:
+                    break
+                if self._idle_count:
+                    # Make room by dropping the least recently used idle handle
+                    path, handles = next(iter(self._idle.items()))
+                    evicted.append(handles.pop(0))
+                    if not handles:
+                        del self._idle[path]
+                    self._idle_count -= 1
+                    continue
+                self._cond.wait()
+            self._in_use += 1
+        
+        self._close(evicted)
+        try:
+            return Repo(repo_path)
+        except BaseException:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+    
+    def _release(self, repo_path: Path, repo: Repo, reuse: bool):
+        with self._cond:
+            self._in_use -= 1
+            if reuse:
+                self._idle.setdefault(repo_path, []).append(repo)
+                self._idle.move_to_end(repo_path)
+                self._idle_count += 1
+            self._cond.notify()
+        if not reuse:
+            self._close([repo])
+    
+    @staticmethod
+    def _close(repos: List[Repo]):
+        for repo in repos:
+            try:
+                repo.close()
+            except Exception:
+                pass
+    
+    def close(self):
+        """Close every idle handle. Handles in use are closed on release."""
+        with self._cond:
+            repos = [repo for handles in self._idle.values() for repo in handles]
+            self._idle.clear()
+            self._idle_count = 0
+        self._close(repos)
 
 
 class GitScanner:
     """Scans git repositories for recent commits."""
     
-    def __init__(self, hours: int = 24, all_authors: bool = False):
+    def __init__(
+        self,
+        hours: int = 24,
+        all_authors: bool = False,
+        diff_context: bool = False,
+        diff_bytes_per_commit: int = Config.DIFF_BYTES_PER_COMMIT,
+        diff_bytes_total: int = Config.DIFF_BYTES_TOTAL,
+        paths: Optional[List[str]] = None,
+        max_open_repos: int = Config.GIT_MAX_OPEN_REPOS
+    ):
         """
         Initialize the scanner.
         
         Args:
             hours: Number of hours to look back for commits
             all_authors: If True, include commits from all authors. If False, only current user.
+            diff_context: If True, attach a condensed view of each commit's diff
+            diff_bytes_per_commit: Cap on diff context kept for one commit
+            diff_bytes_total: Cap on diff context kept for one repository's
+                commits (one prompt's worth)
+            paths: Only consider commits touching these paths (directories,
+                files or glob patterns), and only report those files
+            max_open_repos: Cap on live Repo handles (each keeps git
+                helper processes running)
         """
         self.hours = hours
         self.all_authors = all_authors
         self.cutoff_time = datetime.now() - timedelta(hours=hours)
+        # rev-list --since value; git stops walking at older commits
+        self._since = f"@{int(self.cutoff_time.timestamp())}"
+        self.diff_context = diff_context
+        self.diff_bytes_per_commit = diff_bytes_per_commit
+        self.diff_bytes_total = diff_bytes_total
+        self.pathspecs = [to_pathspec(path) for path in paths or []]
+        self.repo_pool = RepoPool(max_open_repos)
+    
+    def close(self):
+        """Release pooled Repo handles and their git processes."""
+        self.repo_pool.close()
+    
+    def __enter__(self) -> "GitScanner":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
     
     def scan_repository(self, repo_path: Path) -> List[CommitInfo]:
         """
@@ -48,61 +233,252 @@ class GitScanner:
         Returns:
             List of CommitInfo objects for commits within the time range
         """
+        commits = list(self.iter_repository(repo_path))
+        
+        # Sort by timestamp, most recent first
+        commits.sort(key=lambda c: c.timestamp, reverse=True)
+        return commits
+    
+    def iter_repository(self, repo_path: Path) -> Iterator[CommitInfo]:
+        """
+        Lazily yield recent commits from a single repository.
+        
+        The window is read with a single git rev-list limited by --since,
+        while a pooled Repo handle is held; commits are yielded after the
+        handle is back in the pool, so suspended iterators hold none.
+        
+        Args:
+            repo_path: Path to the git repository
+            
+        Yields:
+            CommitInfo objects for commits within the time range, most
+            recent first
+        """
         try:
-            repo = Repo(repo_path)
+            with self.repo_pool.repo(repo_path) as repo:
+                if repo.bare:
+                    return
+                
+                # Get current user's git email
+                user_email = None
+                if not self.all_authors:
+                    try:
+                        git_config = repo.config_reader()
+                        user_email = git_config.get_value("user", "email")
+                    except Exception:
+                        # If can't get email, include all commits
+                        user_email = None
+                
+                commits = self._read_commits(repo, repo_path, user_email)
+            
+        except git.InvalidGitRepositoryError:
+            return
+        except Exception as e:
+            # stderr, so --format json/markdown keeps stdout clean
+            print(f"Warning: Error scanning {repo_path}: {e}", file=sys.stderr)
+            return
+        
+        commits.sort(key=lambda c: c.timestamp, reverse=True)
+        yield from commits
+    
+    def _read_commits(self, repo: Repo, repo_path: Path, user_email: Optional[str]) -> List[CommitInfo]:
+        """Return the in-range commits of one repository."""
+        commits: List[CommitInfo] = []
+        diff_budget = self.diff_bytes_total
+        # Iterate through commits in all branches. --since stops the walk at
+        # the cutoff, and path filters are passed to git so out-of-scope
+        # commits never load. The output is read to the end so git rev-list
+        # exits before the handle is released.
+        for commit in repo.iter_commits(
+            all=True, max_count=MAX_COMMITS_PER_REPO, since=self._since, paths=self.pathspecs
+        ):
+            commit_time = datetime.fromtimestamp(commit.committed_date)
             
-            if repo.bare:
-                return []
+            # Skip commits outside time range
+            if commit_time < self.cutoff_time:
+                continue
+            
+            # Filter by current user if we have their email and not showing all authors
+            if not self.all_authors and user_email and commit.author.email != user_email:
+                continue
+            
+            # Get list of changed files and line churn
+            try:
+                files_changed, insertions, deletions = self._commit_stats(repo, commit)
+            except Exception:
+                files_changed = []
+                insertions = deletions = 0
             
-            commits = []
-            repo_name = repo_path.name
+            diff_context = ""
+            if self.diff_context:
+                diff_context = self.extract_diff_context(
+                    repo_path, commit.hexsha, min(self.diff_bytes_per_commit, diff_budget)
+                )
+                diff_budget -= len(diff_context)
+            
+            commits.append(CommitInfo(
+                sha=commit.hexsha[:8],
+                message=commit.message.strip(),
+                author=commit.author.name,
+                timestamp=commit_time,
+                files_changed=files_changed,
+                repo_name=repo_path.name,
+                author_email=commit.author.email or "",
+                insertions=insertions,
+                deletions=deletions,
+                diff_context=diff_context
+            ))
+        return commits
+    
+    def _commit_stats(self, repo: Repo, commit: Commit):
+        """Return (files, insertions, deletions), limited to the path filters."""
+        if not self.pathspecs:
+            stats = commit.stats
+            return (
+                list(stats.files.keys()),
+                stats.total.get("insertions", 0),
+                stats.total.get("deletions", 0)
+            )
+        
+        # Same comparison commit.stats makes (first parent), but path-limited
+        if commit.parents:
+            output = repo.git.diff(
+                commit.parents[0].hexsha, commit.hexsha,
+                "--numstat", "--no-renames", "--", *self.pathspecs
+            )
+        else:
+            output = repo.git.diff_tree(
+                "--root", "-r", "--no-commit-id", "--numstat", "--no-renames",
+                commit.hexsha, "--", *self.pathspecs
+            )
+        
+        files, insertions, deletions = [], 0, 0
+        for line in output.splitlines():
+            added, removed, path = line.split("\t", 2)
+            files.append(path)
+            # Binary files report "-" for both counts
+            insertions += int(added) if added.isdigit() else 0
+            deletions += int(removed) if removed.isdigit() else 0
+        return files, insertions, deletions
+    
+    def iter_timeline(self, repo_paths: List[Path]) -> Iterator[CommitInfo]:
+        """
+        Yield commits from several repositories in one global timeline.
+        
+        Each repository's in-window commits (a handful) are read and sorted,
+        then k-way merged with a heap. Sorting there is cheap; asking git for
+        --date-order instead would walk each repository's whole history.
+        
+        Args:
+            repo_paths: Repositories to merge
             
-            # Get current user's git email
-            user_email = None
-            if not self.all_authors:
-                try:
-                    git_config = repo.config_reader()
-                    user_email = git_config.get_value("user", "email")
-                except Exception:
-                    # If can't get email, include all commits
-                    user_email = None
+        Yields:
+            CommitInfo objects across all repositories, most recent first
+        """
+        streams = [self.scan_repository(repo_path) for repo_path in repo_paths]
+        yield from heapq.merge(*streams, key=lambda c: c.timestamp, reverse=True)
+    
+    def extract_diff_context(self, repo_path: Path, sha: str, budget: Optional[int] = None) -> str:
+        """
+        Stream a commit's diff and keep only its outline.
+        
+        Only file names, hunk headers (which usually name the enclosing
+        function) and changed lines that declare a symbol are kept. Binary,
+        lock and generated files are skipped. Output is cut at whole lines to
+        fit ``budget``, and git is stopped as soon as the budget is reached,
+        so the cost stays bounded however large the commit is.
+        
+        Args:
+            repo_path: Path to the git repository
+            sha: Commit to describe
+            budget: Maximum length of the returned text
+                (default: diff_bytes_per_commit)
             
-            # Iterate through commits in all branches
-            for commit in repo.iter_commits(all=True, max_count=200):
-                commit_time = datetime.fromtimestamp(commit.committed_date)
+        Returns:
+            Condensed diff text (empty if nothing useful or nothing fits)
+        """
+        if budget is None:
+            budget = self.diff_bytes_per_commit
+        if budget <= 0:
+            return ""
+        
+        kept: List[str] = []
+        used = 0
+        scanned = 0
+        current_file = None
+        skip_file = False
+        seen: set = set()
+        
+        try:
+            proc = subprocess.Popen(
+                ["git", "diff-tree", "-p", "-r", "--root", "--no-commit-id",
+                 "--no-color", "--no-ext-diff", "--unified=0", sha, "--"]
+                + (self.pathspecs or ["."])
+                + [f":(exclude,glob)**/{pattern}" for pattern in SKIPPED_DIFF_PATTERNS],
+                cwd=repo_path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            return ""
+        
+        try:
+            while used < budget:
+                raw = proc.stdout.readline(MAX_DIFF_LINE)
+                scanned += len(raw)
+                if not raw or scanned > MAX_DIFF_SCAN_BYTES:
+                    break
+                line = raw.decode("utf-8", errors="replace").rstrip("\n")
                 
-                # Skip commits outside time range
-                if commit_time < self.cutoff_time:
+                if line.startswith("diff --git "):
+                    path = line.split(" b/", 1)[-1]
+                    skip_file = is_noise_path(path)
+                    current_file = None if skip_file else path
+                    seen = set()
                     continue
-                
-                # Filter by current user if we have their email and not showing all authors
-                if not self.all_authors and user_email and commit.author.email != user_email:
+                if skip_file:
+                    continue
+                if line.startswith("Binary files "):
+                    skip_file = True
                     continue
                 
-                # Get list of changed files
-                try:
-                    files_changed = list(commit.stats.files.keys())
-                except Exception:
-                    files_changed = []
+                if line.startswith("@@"):
+                    # "@@ -1,2 +1,3 @@ def enclosing():" -> "def enclosing():"
+                    entry = line.split("@@", 2)[-1].strip()
+                elif SYMBOL_LINE_RE.match(line):
+                    entry = line[:160]
+                else:
+                    continue
+                if not entry or entry in seen:
+                    continue
+                seen.add(entry)
                 
-                commits.append(CommitInfo(
-                    sha=commit.hexsha[:8],
-                    message=commit.message.strip(),
-                    author=commit.author.name,
-                    timestamp=commit_time,
-                    files_changed=files_changed,
-                    repo_name=repo_name
-                ))
-            
-            # Sort by timestamp, most recent first
-            commits.sort(key=lambda c: c.timestamp, reverse=True)
-            return commits
-            
-        except git.InvalidGitRepositoryError:
-            return []
-        except Exception as e:
-            print(f"Warning: Error scanning {repo_path}: {e}")
-            return []
+                if current_file is not None:
+                    kept.append(current_file)
+                    used += len(current_file) + 1
+                    current_file = None
+                kept.append(f"  {entry}")
+                used += len(entry) + 3
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
+        
+        # Keep whole lines that fit, then drop a trailing file name whose
+        # entries were cut
+        lines: List[str] = []
+        size = 0
+        for line in kept:
+            cost = len(line) + (1 if lines else 0)
+            if size + cost > budget:
+                break
+            lines.append(line)
+            size += cost
+        while lines and not lines[-1].startswith("  "):
+            lines.pop()
+        
+        return "\n".join(lines)
     
     def find_repositories(self, root_path: Path, max_depth: int = 3) -> List[Path]:
         """
@@ -167,6 +543,34 @@ class GitScanner:
         return results
 
 
+def is_noise_path(path: str) -> bool:
+    """Return True for lock, generated, vendored or minified files."""
+    return bool(NOISE_PATH_RE.match(path) or NOISE_PATH_RE.match(os.path.basename(path)))
+
+
+def to_pathspec(path: str) -> str:
+    """
+    Turn a user path filter into a git pathspec.
+    
+    Patterns containing glob characters use git's ``glob`` magic, so ``*``
+    stays within one directory and ``**`` spans several. Unlike a plain git
+    pathspec, ``*.py`` therefore only matches files at the repository root;
+    ``**/*.py`` matches them at any depth. This is deliberate: patterns
+    behave like shell globs rather than git's looser default.
+    
+    Args:
+        path: Directory, file or glob pattern relative to the repository root
+        
+    Returns:
+        Pathspec string
+    """
+    if path.startswith(":"):
+        return path  # Already a pathspec
+    if any(char in path for char in "*?["):
+        return f":(glob){path}"
+    return path
+
+
 def format_commits_for_llm(commits: List[CommitInfo]) -> str:
     """
     Format commits into a text representation for LLM input.
@@ -190,5 +594,8 @@ def format_commits_for_llm(commits: List[CommitInfo]) -> str:
             if len(commit.files_changed) > 3:
                 files_preview.append(f"... and {len(commit.files_changed) - 3} more")
             lines.append(f"  Files: {', '.join(files_preview)}")
+        if commit.diff_context:
+            lines.append("  Changes:")
+            lines.extend(f"    {line}" for line in commit.diff_context.splitlines())
     
     return "\n".join(lines)
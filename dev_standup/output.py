@@ -0,0 +1,76 @@
+"""
+Machine-friendly renderings of standup summaries (markdown and JSON).
+
+The colored terminal output lives in the CLI; these renderers take the same
+per-repository results and produce a document for pasting into chat or
+feeding to other tools.
+"""
+
+import json
+from datetime import datetime
+from typing import List
+
+from dev_standup.pipeline import RepoSummary
+
+OUTPUT_FORMATS = ["text", "markdown", "json"]
+
+
+def render_markdown(results: List[RepoSummary], moods: List[str], hours: int) -> str:
+    """
+    Render summaries as a markdown document.
+    
+    Repositories become sections; with several moods each mood gets a
+    subsection.
+    
+    Args:
+        results: Per-repository summaries
+        moods: Moods that were generated, in display order
+        hours: Look-back window the commits came from
+    
+    Returns:
+        Markdown text
+    """
+    lines = [f"# Standup summary (last {hours} hours)", ""]
+    for result in results:
+        if len(results) > 1:
+            lines += [f"## {result.repo_name}", ""]
+        for mood in moods:
+            if len(moods) > 1:
+                heading = "###" if len(results) > 1 else "##"
+                lines += [f"{heading} {mood.capitalize()}", ""]
+            lines += [result.summaries[mood].strip(), ""]
+    return "\n".join(lines)
+
+
+def render_json(results: List[RepoSummary], moods: List[str], hours: int) -> str:
+    """
+    Render summaries as JSON.
+    
+    Args:
+        results: Per-repository summaries
+        moods: Moods that were generated
+        hours: Look-back window the commits came from
+    
+    Returns:
+        JSON text with one entry per repository and one summary per mood
+    """
+    document = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "hours": hours,
+        "moods": moods,
+        "repositories": [
+            {
+                "name": result.repo_name,
+                "commits": [commit.sha for commit in result.commits],
+                "summaries": {mood: result.summaries[mood] for mood in moods},
+            }
+            for result in results
+        ],
+    }
+    return json.dumps(document, indent=2, ensure_ascii=False)
+
+
+RENDERERS = {
+    "markdown": render_markdown,
+    "json": render_json,
+}
@@ -0,0 +1,159 @@
+"""
+Pipelined scan -> summarize execution.
+
+Repositories are scanned on a small pool of threads and each repository's
+commits are handed to the summarization stage as soon as its scan finishes,
+so git and the LLM work at the same time. Bounded queues between the stages
+provide backpressure: scanners pause when the LLM falls behind.
+"""
+
+import queue
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Union
+
+from dev_standup.config import Config
+from dev_standup.git_scanner import CommitInfo, GitScanner
+from dev_standup.summarizer import BaseSummarizer, summarize_moods
+
+# Marks the end of a stage's output
+_DONE = object()
+
+# How often blocked workers check whether the consumer has stopped
+_POLL_SECONDS = 0.1
+
+
+@dataclass
+class RepoSummary:
+    """Summaries produced for one repository, one per mood."""
+    repo_name: str
+    commits: List[CommitInfo]
+    summaries: Dict[str, str]
+    
+    @property
+    def summary(self) -> str:
+        """Summary in the first (or only) mood."""
+        return next(iter(self.summaries.values()))
+
+
+class ScanSummarizePipeline:
+    """Overlaps repository scanning with LLM summarization."""
+    
+    def __init__(
+        self,
+        scanner: GitScanner,
+        summarizer: Union[BaseSummarizer, Dict[str, BaseSummarizer]],
+        scan_workers: int = Config.PIPELINE_SCAN_WORKERS,
+        llm_workers: int = Config.PIPELINE_LLM_WORKERS,
+        queue_size: int = Config.PIPELINE_QUEUE_SIZE
+    ):
+        """
+        Initialize the pipeline.
+        
+        Args:
+            scanner: Scanner used for every repository
+            summarizer: Summarizer used for every repository, or a dictionary
+                mapping moods to summarizers to summarize in several moods
+            scan_workers: Number of concurrent repository scans
+            llm_workers: Number of concurrent LLM requests
+            queue_size: Scanned repositories that may wait for the LLM
+                before scanners block
+        """
+        self.scanner = scanner
+        if isinstance(summarizer, BaseSummarizer):
+            summarizer = {summarizer.mood: summarizer}
+        self.summarizers = summarizer
+        self.scan_workers = max(1, scan_workers)
+        self.llm_workers = max(1, llm_workers)
+        self.queue_size = max(1, queue_size)
+    
+    def run(self, repo_paths: List[Path]) -> Iterator[RepoSummary]:
+        """
+        Scan and summarize repositories, yielding results as they complete.
+        
+        Repositories without commits in range are skipped. Results arrive in
+        completion order, not in the order of ``repo_paths``. If the caller
+        stops iterating early, workers finish their current repository and
+        exit instead of blocking on full queues.
+        
+        Args:
+            repo_paths: Repositories to process
+        
+        Yields:
+            RepoSummary for each repository with commits
+        """
+        paths = iter(repo_paths)
+        paths_lock = threading.Lock()
+        scanned: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        results: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        stopped = threading.Event()
+        
+        def put(target: queue.Queue, item) -> bool:
+            # False once the consumer has stopped reading
+            while not stopped.is_set():
+                try:
+                    target.put(item, timeout=_POLL_SECONDS)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def get(source: queue.Queue):
+            while not stopped.is_set():
+                try:
+                    return source.get(timeout=_POLL_SECONDS)
+                except queue.Empty:
+                    continue
+            return _DONE
+        
+        def scan_worker():
+            while not stopped.is_set():
+                with paths_lock:
+                    repo_path = next(paths, None)
+                if repo_path is None:
+                    return
+                commits = self.scanner.scan_repository(repo_path)
+                if commits and not put(scanned, (repo_path.name, commits)):
+                    return
+        
+        def close_scan_stage(workers: List[threading.Thread]):
+            for worker in workers:
+                worker.join()
+            for _ in range(self.llm_workers):
+                put(scanned, _DONE)
+        
+        def llm_worker():
+            while True:
+                item = get(scanned)
+                if item is _DONE:
+                    put(results, _DONE)
+                    return
+                repo_name, commits = item
+                summary = RepoSummary(repo_name, commits, summarize_moods(self.summarizers, commits))
+                if not put(results, summary):
+                    return
+        
+        scan_threads = [
+            threading.Thread(target=scan_worker, name=f"scan-{i}", daemon=True)
+            for i in range(self.scan_workers)
+        ]
+        llm_threads = [
+            threading.Thread(target=llm_worker, name=f"llm-{i}", daemon=True)
+            for i in range(self.llm_workers)
+        ]
+        for thread in scan_threads + llm_threads:
+            thread.start()
+        threading.Thread(target=close_scan_stage, args=(scan_threads,), daemon=True).start()
+        
+        finished = 0
+        try:
+            while finished < self.llm_workers:
+                item = results.get()
+                if item is _DONE:
+                    finished += 1
+                else:
+                    yield item
+        finally:
+            # Also runs when the caller breaks out or the generator is closed
+            stopped.set()
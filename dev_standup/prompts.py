@@ -55,6 +55,17 @@ Rules:
 - Use emojis like ⚔️ 🛡️ 🏆 🔥"""
 
 
+# Marker that introduces each repository in a packed (multi-repo) request.
+REPO_SECTION_MARKER = "### REPO:"
+
+PACKED_INSTRUCTIONS = """The commits below come from several repositories. Each repository's commits
+start with a line "{marker} <name>". Write a separate summary for EVERY repository.
+Begin each summary with the exact same "{marker} <name>" line, followed only by that
+repository's bullet points. Do not add any text outside these sections.
+
+"""
+
+
 def get_prompts(mood: str) -> tuple[str, str]:
     """
     Get system and user prompt templates for the specified mood.
@@ -73,3 +84,18 @@ def get_prompts(mood: str) -> tuple[str, str]:
         return HERO_SYSTEM_PROMPT, HERO_USER_TEMPLATE
     else:
         return NEUTRAL_SYSTEM_PROMPT, NEUTRAL_USER_TEMPLATE
+
+
+def get_packed_template(mood: str) -> str:
+    """
+    Get the user prompt template for a packed multi-repository request.
+    
+    Args:
+        mood: One of "neutral", "roast", or "hero"
+        
+    Returns:
+        User template with a {commits} placeholder
+    """
+    _, user_template = get_prompts(mood)
+    return PACKED_INSTRUCTIONS.format(marker=REPO_SECTION_MARKER) + user_template
+
@@ -0,0 +1,184 @@
+"""
+Incremental weekly and sprint rollups built from stored daily summaries.
+
+Each generated daily summary is saved per repository, day and variant (mood,
+scan scope and models) together with the commit SHAs it covers. A rollup
+reuses every stored day whose commits haven't changed and only asks the LLM
+about new or changed days, so the cost of a weekly report grows with the new
+days, not the whole window.
+"""
+
+import hashlib
+import json
+import math
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import List, Optional
+
+from dev_standup.config import Config
+from dev_standup.git_scanner import CommitInfo, GitScanner
+from dev_standup.summarizer import BaseSummarizer
+
+ROLLUP_PERIODS = {
+    "week": 7,
+    "sprint": Config.SPRINT_DAYS,
+}
+
+
+@dataclass
+class DailySummary:
+    """Summary of one repository's commits on one day."""
+    day: date
+    commits: List[CommitInfo]
+    summary: str
+    reused: bool
+
+
+class SummaryStore:
+    """Daily summaries on disk, one JSON file per repository, day and variant."""
+    
+    def __init__(self, root: Optional[Path] = None):
+        """
+        Initialize the store.
+        
+        Args:
+            root: Storage directory (default: SUMMARY_STORE_DIR)
+        """
+        self.root = root or Path(Config.SUMMARY_STORE_DIR).expanduser()
+    
+    def _path(self, repo_path: Path, day: date, variant: str) -> Path:
+        # Name for readability, hash so same-named repos don't collide
+        resolved = str(repo_path.resolve())
+        digest = hashlib.sha1(resolved.encode("utf-8")).hexdigest()[:8]
+        return self.root / f"{repo_path.name}-{digest}" / f"{day.isoformat()}.{variant}.json"
+    
+    def load(self, repo_path: Path, day: date, variant: str) -> Optional[dict]:
+        """
+        Load a stored daily summary.
+        
+        Args:
+            repo_path: Repository the summary belongs to
+            day: Day the summary covers
+            variant: Key from summary_variant()
+        
+        Returns:
+            Stored entry with "shas" and "summary", or None
+        """
+        path = self._path(repo_path, day, variant)
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+    
+    def save(self, repo_path: Path, day: date, variant: str, shas: List[str], summary: str):
+        """Store a daily summary (written atomically)."""
+        path = self._path(repo_path, day, variant)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "repo": str(repo_path),
+                "day": day.isoformat(),
+                "variant": variant,
+                "shas": sorted(shas),
+                "summary": summary,
+                "generated_at": datetime.now().isoformat(timespec="seconds"),
+            }, f, indent=2)
+        os.replace(tmp_path, path)
+
+
+def summary_variant(mood: str, scanner: GitScanner) -> str:
+    """
+    Key separating summaries of differently scoped scans and models.
+    
+    A summary of only your commits, or only some paths, must not be reused
+    for a wider scan of the same day, and one written by another provider
+    or model must not stand in for this one. Anything that changes the
+    commit selection, the prompt or the model goes into the key.
+    
+    Args:
+        mood: Summary mood
+        scanner: Scanner the commits came from
+    
+    Returns:
+        Mood plus a short hash of the scope, e.g. "neutral-3fa2b1c0"
+    """
+    scope = {
+        "all_authors": scanner.all_authors,
+        "diff_context": scanner.diff_context,
+        "paths": sorted(scanner.pathspecs),
+        "models": Config.model_chain(),
+    }
+    digest = hashlib.sha1(json.dumps(scope, sort_keys=True).encode("utf-8")).hexdigest()[:8]
+    return f"{mood}-{digest}"
+
+
+def rollup_hours(days: int, now: Optional[datetime] = None) -> int:
+    """
+    Hours to scan so the window starts at midnight ``days - 1`` days ago.
+    
+    Args:
+        days: Number of calendar days including today
+        now: Current time (default: now)
+    
+    Returns:
+        Look-back in whole hours
+    """
+    now = now or datetime.now()
+    start = datetime.combine(now.date() - timedelta(days=days - 1), datetime.min.time())
+    return math.ceil((now - start).total_seconds() / 3600)
+
+
+def build_rollup(
+    repo_path: Path,
+    commits: List[CommitInfo],
+    summarizer: BaseSummarizer,
+    store: SummaryStore,
+    variant: str,
+    days: int
+) -> List[DailySummary]:
+    """
+    Produce one summary per day, reusing stored days whose commits are unchanged.
+    
+    A stored day is reused when it already covers every commit seen for
+    that day now; otherwise the day is summarized again and stored.
+    
+    Args:
+        repo_path: Repository the commits belong to
+        commits: Commits from the rollup window
+        summarizer: Summarizer for missing or changed days
+        store: Where daily summaries live
+        variant: Key from summary_variant()
+        days: Number of calendar days in the window, including today
+    
+    Returns:
+        Daily summaries, oldest day first
+    
+    Raises:
+        Exception: If the summarizer fails for a day that has to be generated
+    """
+    first_day = date.today() - timedelta(days=days - 1)
+    by_day = defaultdict(list)
+    for commit in commits:
+        if commit.timestamp.date() >= first_day:
+            by_day[commit.timestamp.date()].append(commit)
+    
+    dailies = []
+    for day in sorted(by_day):
+        day_commits = by_day[day]
+        shas = [c.sha for c in day_commits]
+        
+        stored = store.load(repo_path, day, variant)
+        if stored and set(shas) <= set(stored.get("shas", [])):
+            dailies.append(DailySummary(day, day_commits, stored["summary"], reused=True))
+            continue
+        
+        summary = summarizer.generate(day_commits)
+        store.save(repo_path, day, variant, shas, summary)
+        dailies.append(DailySummary(day, day_commits, summary, reused=False))
+    
+    return dailies
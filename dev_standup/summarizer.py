@@ -3,147 +3,600 @@ LLM integration for commit summarization.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Union
 import json
+import re
+import threading
 
 from dev_standup.config import Config
-from dev_standup.prompts import get_prompts
+from dev_standup.prompts import get_prompts, get_packed_template, REPO_SECTION_MARKER
 from dev_standup.git_scanner import CommitInfo, format_commits_for_llm
+from dev_standup.extractive import extractive_summary
+from dev_standup.transport import Transport, get_transport
+
+
+# Output tokens requested for a single summary
+MAX_SUMMARY_TOKENS = 500
+
+# Output tokens reserved per repository in a packed request
+PACKED_TOKENS_PER_REPO = 250
+
+_SECTION_RE = re.compile(r"^[#*\s]*" + re.escape(REPO_SECTION_MARKER.strip("# ")) + r"\s*(.+?)[*\s]*$")
+
+
+class SummarizerError(Exception):
+    """Raised when an LLM backend fails to produce a summary."""
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about 4 characters per token for English/code)."""
+    return len(text) // 4 + 1
 
 
 class BaseSummarizer(ABC):
     """Base class for LLM summarizers."""
     
-    def __init__(self, mood: str = "neutral"):
+    def __init__(self, mood: str = "neutral", transport: Optional[Transport] = None):
         """
         Initialize the summarizer.
         
         Args:
             mood: Mood for the summary ("neutral", "roast", or "hero")
+            transport: Transport for LLM requests (default: the configured one)
         """
         self.mood = mood
         self.system_prompt, self.user_template = get_prompts(mood)
+        self.transport = transport or get_transport()
     
-    @abstractmethod
-    def summarize(self, commits: List[CommitInfo]) -> str:
+    def summarize(self, commits: List[CommitInfo], commits_text: Optional[str] = None) -> str:
         """
         Summarize commits using the LLM.
         
+        Errors are reported in the returned text rather than raised.
+        
+        Args:
+            commits: List of commit information
+            commits_text: The commits already run through format_commits_for_llm,
+                to share one formatting between several summarizers
+            
+        Returns:
+            Summarized text
+        """
+        if not commits:
+            return "No commits to summarize."
+        
+        try:
+            return self.generate(commits, commits_text=commits_text)
+        except Exception as e:
+            return self._describe_error(e)
+    
+    def generate(
+        self,
+        commits: List[CommitInfo],
+        first_token: Optional[threading.Event] = None,
+        commits_text: Optional[str] = None
+    ) -> str:
+        """
+        Summarize commits, raising on failure.
+        
         Args:
             commits: List of commit information
+            first_token: Optional event set as soon as output starts arriving
+            commits_text: Pre-formatted commits (see summarize())
             
         Returns:
             Summarized text
+            
+        Raises:
+            Exception: If the backend fails to produce a summary
+        """
+        return self.complete(self._format_prompt(commits, commits_text), first_token=first_token)
+    
+    def summarize_packed(
+        self,
+        repos_commits: Dict[str, List[CommitInfo]],
+        token_budget: int = Config.PACK_TOKEN_BUDGET,
+        max_repos: int = Config.PACK_MAX_REPOS
+    ) -> Dict[str, str]:
+        """
+        Summarize several repositories with as few LLM requests as possible.
+        
+        Small repositories are packed into shared requests whose commit text
+        stays under ``token_budget``; the response is split back into one
+        summary per repository. Repositories too large to share a request,
+        and any section the model leaves out, get an individual call.
+        
+        Args:
+            repos_commits: Dictionary mapping repository names to commits
+            token_budget: Approximate input-token budget per packed request
+            max_repos: Maximum number of repositories per packed request
+            
+        Returns:
+            Dictionary mapping repository names to summaries, in input order
+        """
+        sections = {
+            name: f"{REPO_SECTION_MARKER} {name}\n{format_commits_for_llm(commits)}"
+            for name, commits in repos_commits.items()
+        }
+        
+        # Greedy packing in input order
+        packs: List[List[str]] = []
+        current: List[str] = []
+        current_tokens = 0
+        for name, section in sections.items():
+            tokens = estimate_tokens(section)
+            if tokens > token_budget:
+                packs.append([name])
+                continue
+            if current and (current_tokens + tokens > token_budget or len(current) >= max_repos):
+                packs.append(current)
+                current, current_tokens = [], 0
+            current.append(name)
+            current_tokens += tokens
+        if current:
+            packs.append(current)
+        
+        summaries: Dict[str, str] = {}
+        for pack in packs:
+            if len(pack) > 1:
+                summaries.update(self._complete_pack(pack, sections))
+            for name in pack:
+                if not summaries.get(name):
+                    summaries[name] = self.summarize(repos_commits[name])
+        
+        return {name: summaries[name] for name in repos_commits}
+    
+    def _complete_pack(self, names: List[str], sections: Dict[str, str]) -> Dict[str, str]:
+        """Run one packed request and split the answer per repository."""
+        template = get_packed_template(self.mood)
+        user_prompt = template.format(commits="\n\n".join(sections[n] for n in names))
+        
+        try:
+            response = self.complete(
+                user_prompt,
+                max_tokens=PACKED_TOKENS_PER_REPO * len(names)
+            )
+        except Exception:
+            # Callers fall back to individual requests for missing sections
+            return {}
+        
+        return split_packed_response(response, names)
+    
+    @abstractmethod
+    def complete(
+        self,
+        user_prompt: str,
+        max_tokens: int = MAX_SUMMARY_TOKENS,
+        first_token: Optional[threading.Event] = None
+    ) -> str:
+        """
+        Send a user prompt (with this summarizer's system prompt) to the LLM.
+        
+        Args:
+            user_prompt: Fully formatted user prompt
+            max_tokens: Maximum number of tokens to generate
+            first_token: Optional event set as soon as output starts arriving;
+                backends stream the response when it is given
+            
+        Returns:
+            Generated text
         """
         pass
     
-    def _format_prompt(self, commits: List[CommitInfo]) -> str:
+    def health_check(self) -> bool:
+        """
+        Cheaply check whether the backend can serve requests right now.
+        
+        Returns:
+            True if the backend looks usable
+        """
+        return True
+    
+    def warm_up(self) -> bool:
+        """
+        Prepare the backend for the first request (e.g. load a local model).
+        
+        Returns:
+            True if the backend did any warm-up work
+        """
+        return False
+    
+    def _format_prompt(self, commits: List[CommitInfo], commits_text: Optional[str] = None) -> str:
         """Format commits into the user prompt."""
-        commits_text = format_commits_for_llm(commits)
+        if commits_text is None:
+            commits_text = format_commits_for_llm(commits)
         return self.user_template.format(commits=commits_text)
+    
+    def _describe_error(self, error: Exception) -> str:
+        """Turn a backend error into user-facing text."""
+        return f"Error generating summary: {error}"
 
 
 class OpenAISummarizer(BaseSummarizer):
     """Summarizer using OpenAI API."""
     
-    def __init__(self, mood: str = "neutral"):
-        super().__init__(mood)
+    def __init__(self, mood: str = "neutral", transport: Optional[Transport] = None):
+        super().__init__(mood, transport)
         
-        from openai import OpenAI
-        self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
         self.model = Config.OPENAI_MODEL
+        self.client = None
+        if not self.transport.offline:
+            from openai import OpenAI
+            self.client = OpenAI(api_key=Config.OPENAI_API_KEY, timeout=Config.LLM_TIMEOUT)
     
-    def summarize(self, commits: List[CommitInfo]) -> str:
-        """Summarize commits using OpenAI."""
-        if not commits:
-            return "No commits to summarize."
-        
-        user_prompt = self._format_prompt(commits)
+    def health_check(self) -> bool:
+        """OpenAI is usable whenever a key is configured."""
+        return self.transport.offline or bool(Config.OPENAI_API_KEY)
+    
+    def complete(
+        self,
+        user_prompt: str,
+        max_tokens: int = MAX_SUMMARY_TOKENS,
+        first_token: Optional[threading.Event] = None
+    ) -> str:
+        """Send a prompt to OpenAI."""
+        request = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": self.system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "temperature": 0.7,
+            "max_tokens": max_tokens
+        }
+        return self.transport.send(
+            "openai", request, lambda: self._chat(request, first_token), first_token
+        )
+    
+    def _chat(self, request: dict, first_token: Optional[threading.Event]) -> str:
+        response = self.client.chat.completions.create(
+            **request,
+            stream=first_token is not None
+        )
         
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.7,
-                max_tokens=500
-            )
-            
+        if first_token is None:
             return response.choices[0].message.content.strip()
         
-        except Exception as e:
-            return f"Error generating summary: {e}"
+        parts = []
+        for chunk in response:
+            content = chunk.choices[0].delta.content if chunk.choices else None
+            if content:
+                parts.append(content)
+                first_token.set()
+        return "".join(parts).strip()
+
+
+def ollama_keep_alive(value: str) -> Union[str, int]:
+    """
+    Convert an OLLAMA_KEEP_ALIVE setting to the value Ollama expects.
+    
+    Ollama parses strings as durations ("30m"), so a bare number such as
+    "-1" (forever) or "0" (unload now) has to be sent as a JSON number of
+    seconds.
+    
+    Args:
+        value: Setting from the environment
+    
+    Returns:
+        Seconds as an int for bare numbers, otherwise the duration string
+    """
+    value = value.strip()
+    if value.lstrip("-").isdigit():
+        return int(value)
+    return value
 
 
 class OllamaSummarizer(BaseSummarizer):
-    """Summarizer using local Ollama."""
+    """
+    Summarizer using local Ollama.
+    
+    Requests go through ``/api/chat`` with the system prompt as a separate
+    leading message, so every request in a run shares an identical prefix
+    that Ollama's prompt cache can reuse instead of re-evaluating. Each
+    request also passes ``keep_alive`` to keep the model resident between
+    standups.
+    """
     
-    def __init__(self, mood: str = "neutral"):
-        super().__init__(mood)
+    def __init__(self, mood: str = "neutral", transport: Optional[Transport] = None):
+        super().__init__(mood, transport)
         
         import requests
         self.requests = requests
+        self.session = requests.Session()
         self.base_url = Config.OLLAMA_BASE_URL
         self.model = Config.OLLAMA_MODEL
+        self.keep_alive = ollama_keep_alive(Config.OLLAMA_KEEP_ALIVE)
     
-    def summarize(self, commits: List[CommitInfo]) -> str:
-        """Summarize commits using Ollama."""
-        if not commits:
-            return "No commits to summarize."
+    def warm_up(self) -> bool:
+        """
+        Load the model into memory ahead of the first real request.
         
-        user_prompt = self._format_prompt(commits)
+        Returns:
+            True if Ollama reported the model as loaded
+        """
+        if self.transport.offline:
+            return False
         
         try:
-            # Combine system and user prompts for Ollama
-            full_prompt = f"{self.system_prompt}\n\n{user_prompt}"
-            
-            response = self.requests.post(
-                f"{self.base_url}/api/generate",
+            response = self.session.post(
+                f"{self.base_url}/api/chat",
                 json={
                     "model": self.model,
-                    "prompt": full_prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.7,
-                        "num_predict": 500
-                    }
+                    "messages": [],
+                    "keep_alive": self.keep_alive
                 },
-                timeout=60
+                timeout=(2, 120)
             )
-            
-            if response.status_code == 200:
-                result = response.json()
-                return result.get("response", "").strip()
-            else:
-                return f"Error: Ollama returned status {response.status_code}"
+            return response.status_code == 200
+        except self.requests.exceptions.RequestException:
+            return False
+    
+    def health_check(self) -> bool:
+        """Check that the Ollama server answers within the health timeout."""
+        if self.transport.offline:
+            return True
+        
+        try:
+            response = self.session.get(
+                f"{self.base_url}/api/tags",
+                timeout=Config.HEALTH_TIMEOUT
+            )
+            return response.status_code == 200
+        except self.requests.exceptions.RequestException:
+            return False
+    
+    def complete(
+        self,
+        user_prompt: str,
+        max_tokens: int = MAX_SUMMARY_TOKENS,
+        first_token: Optional[threading.Event] = None
+    ) -> str:
+        """Send a prompt to Ollama."""
+        request = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": self.system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "temperature": 0.7,
+            "max_tokens": max_tokens
+        }
+        return self.transport.send(
+            "ollama", request, lambda: self._chat(request, first_token), first_token
+        )
+    
+    def _chat(self, request: dict, first_token: Optional[threading.Event]) -> str:
+        stream = first_token is not None
+        response = self.session.post(
+            f"{self.base_url}/api/chat",
+            json={
+                "model": request["model"],
+                "messages": request["messages"],
+                "stream": stream,
+                "keep_alive": self.keep_alive,
+                "options": {
+                    "temperature": request["temperature"],
+                    "num_predict": request["max_tokens"]
+                }
+            },
+            # A short connect timeout fails fast when Ollama isn't running;
+            # the read timeout bounds a wedged server (per chunk when streaming)
+            timeout=(Config.CONNECT_TIMEOUT, Config.LLM_TIMEOUT),
+            stream=stream
+        )
         
-        except self.requests.exceptions.ConnectionError:
+        if response.status_code != 200:
+            raise SummarizerError(f"Ollama returned status {response.status_code}")
+        
+        if not stream:
+            result = response.json()
+            return result.get("message", {}).get("content", "").strip()
+        
+        parts = []
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = json.loads(line)
+            content = chunk.get("message", {}).get("content", "")
+            if content:
+                parts.append(content)
+                first_token.set()
+            if chunk.get("done"):
+                break
+        return "".join(parts).strip()
+    
+    def _describe_error(self, error: Exception) -> str:
+        """Map Ollama connection problems to actionable hints."""
+        if isinstance(error, self.requests.exceptions.ConnectionError):
             return (
                 "Error: Cannot connect to Ollama. "
                 "Make sure Ollama is running (http://localhost:11434) "
                 "or switch to OpenAI by setting LLM_PROVIDER=openai in .env"
             )
-        except Exception as e:
-            return f"Error generating summary: {e}"
+        if isinstance(error, SummarizerError):
+            return f"Error: {error}"
+        return super()._describe_error(error)
+
+
+class ExtractiveSummarizer(BaseSummarizer):
+    """Offline summarizer that builds summaries from commit metadata, no LLM."""
+    
+    def generate(
+        self,
+        commits: List[CommitInfo],
+        first_token: Optional[threading.Event] = None,
+        commits_text: Optional[str] = None
+    ) -> str:
+        """Build an extractive summary (from the commits; prompt text is unused)."""
+        summary = extractive_summary(commits, self.mood)
+        if first_token is not None:
+            first_token.set()
+        return summary
+    
+    def summarize_packed(
+        self,
+        repos_commits: Dict[str, List[CommitInfo]],
+        token_budget: int = Config.PACK_TOKEN_BUDGET,
+        max_repos: int = Config.PACK_MAX_REPOS
+    ) -> Dict[str, str]:
+        """Summarize each repository directly; there are no requests to pack."""
+        return {name: self.summarize(commits) for name, commits in repos_commits.items()}
+    
+    def complete(
+        self,
+        user_prompt: str,
+        max_tokens: int = MAX_SUMMARY_TOKENS,
+        first_token: Optional[threading.Event] = None
+    ) -> str:
+        """Free-form prompts need a language model."""
+        raise SummarizerError("The extractive provider cannot answer free-form prompts")
+
+
+def summarize_moods(
+    summarizers: Dict[str, BaseSummarizer],
+    commits: List[CommitInfo]
+) -> Dict[str, str]:
+    """
+    Summarize the same commits in several moods at once.
+    
+    The commits are formatted once and every mood's request runs
+    concurrently, so each extra mood adds only its own inference time.
+    Errors are reported in the returned text, as with summarize().
+    
+    Args:
+        summarizers: Dictionary mapping moods to summarizers
+        commits: List of commit information
+        
+    Returns:
+        Dictionary mapping moods to summaries, in the order of ``summarizers``
+    """
+    if len(summarizers) == 1:
+        [(mood, summarizer)] = summarizers.items()
+        return {mood: summarizer.summarize(commits)}
+    
+    commits_text = format_commits_for_llm(commits)
+    with ThreadPoolExecutor(len(summarizers), thread_name_prefix="mood") as pool:
+        futures = {
+            mood: pool.submit(summarizer.summarize, commits, commits_text)
+            for mood, summarizer in summarizers.items()
+        }
+        return {mood: future.result() for mood, future in futures.items()}
+
+
+def create_summarizers(moods: List[str]) -> Dict[str, BaseSummarizer]:
+    """
+    Create one summarizer per mood.
+    
+    With a provider chain, the chains share one health probe and one set of
+    circuit breakers, so a dead provider is probed and tripped once, not
+    once per mood.
+    
+    Args:
+        moods: Moods to summarize in
+        
+    Returns:
+        Dictionary mapping moods to summarizers, in the order given
+    """
+    moods = list(dict.fromkeys(moods))
+    first = create_summarizer(mood=moods[0])
+    summarizers = {moods[0]: first}
+    for mood in moods[1:]:
+        summarizers[mood] = create_summarizer(mood=mood, breakers=getattr(first, "breakers", None))
+    return summarizers
 
 
-def create_summarizer(mood: str = "neutral") -> BaseSummarizer:
+def split_packed_response(response: str, names: List[str]) -> Dict[str, str]:
+    """
+    Split a packed response into per-repository summaries.
+    
+    Args:
+        response: Raw LLM output containing one section per repository
+        names: Repository names that were sent in the request
+        
+    Returns:
+        Dictionary with the non-empty sections that matched a known name
+    """
+    wanted = {name.lower(): name for name in names}
+    sections: Dict[str, List[str]] = {}
+    current = None
+    
+    for line in response.splitlines():
+        match = _SECTION_RE.match(line)
+        if match:
+            current = wanted.get(match.group(1).strip().lower())
+            if current is not None:
+                sections[current] = []
+            continue
+        if current is not None:
+            sections[current].append(line)
+    
+    return {
+        name: "\n".join(lines).strip()
+        for name, lines in sections.items()
+        if "\n".join(lines).strip()
+    }
+
+
+def preload_model() -> bool:
+    """
+    Ask the configured provider to load its model ahead of the first summary.
+    
+    Meant to run in a background thread while repositories are scanned.
+    
+    Returns:
+        True if the provider did any warm-up work
+    """
+    if "ollama" in Config.provider_chain():
+        return OllamaSummarizer().warm_up()
+    return False
+
+
+def create_summarizer(mood: str = "neutral", breakers: Optional[dict] = None) -> BaseSummarizer:
     """
     Create a summarizer based on the configured LLM provider.
     
+    When fallback providers are configured, returns a ProviderChain that
+    fails over (and optionally hedges) between them.
+    
     Args:
         mood: Mood for the summary
+        breakers: Circuit breakers of an existing chain to share; the new
+            chain then skips its own startup probe
         
     Returns:
         Appropriate summarizer instance
     """
-    provider = Config.LLM_PROVIDER
+    providers = Config.provider_chain()
+    if len(providers) > 1:
+        from dev_standup.failover import ProviderChain
+        return ProviderChain(
+            mood,
+            [create_provider(name, mood) for name in providers],
+            hedge_after=Config.HEDGE_AFTER or None,
+            probe=breakers is None,
+            breakers=breakers
+        )
     
+    return create_provider(providers[0], mood)
+
+
+def create_provider(provider: str, mood: str = "neutral") -> BaseSummarizer:
+    """
+    Create the summarizer for a single named provider.
+    
+    Args:
+        provider: "openai", "ollama", or "extractive"
+        mood: Mood for the summary
+        
+    Returns:
+        Summarizer instance
+    """
     if provider == "openai":
         return OpenAISummarizer(mood)
     elif provider == "ollama":
         return OllamaSummarizer(mood)
+    elif provider == "extractive":
+        return ExtractiveSummarizer(mood)
     else:
         raise ValueError(f"Unknown LLM provider: {provider}")
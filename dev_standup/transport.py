@@ -0,0 +1,184 @@
+"""
+Transport layer between summarizers and LLM backends.
+
+Every LLM request goes through a transport:
+
+- live: call the backend (default)
+- record: call the backend and append the request/response pair to a cassette
+- replay: answer from a cassette without any network, with simulated
+  latency, time-to-first-token and token rate
+
+Replay makes benchmarks and tests of the summarization path reproducible.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from dev_standup.config import Config
+
+
+class TransportError(Exception):
+    """Raised when a transport cannot serve a request."""
+
+
+def request_key(provider: str, request: dict) -> str:
+    """Stable hash identifying a request in a cassette."""
+    canonical = json.dumps({"provider": provider, "request": request}, sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class Transport:
+    """Live transport: sends requests straight to the backend."""
+    
+    # True if requests never reach a real backend
+    offline = False
+    
+    def send(
+        self,
+        provider: str,
+        request: dict,
+        call: Callable[[], str],
+        first_token: Optional[threading.Event] = None
+    ) -> str:
+        """
+        Send one request.
+        
+        Args:
+            provider: Backend name, part of the cassette key
+            request: Provider-independent description of the request
+                (model, messages, generation options)
+            call: Performs the real request and returns the generated text
+            first_token: Optional event to set when output starts arriving
+        
+        Returns:
+            Generated text
+        """
+        return call()
+
+
+class RecordingTransport(Transport):
+    """Calls the backend and records every request/response pair."""
+    
+    def __init__(self, cassette: Path):
+        """
+        Initialize the recorder.
+        
+        Args:
+            cassette: JSON-lines file to append to
+        """
+        self.cassette = cassette
+        self._lock = threading.Lock()
+    
+    def send(self, provider, request, call, first_token=None) -> str:
+        started = time.perf_counter()
+        response = call()
+        latency = time.perf_counter() - started
+        
+        entry = {
+            "key": request_key(provider, request),
+            "provider": provider,
+            "request": request,
+            "response": response,
+            "latency": round(latency, 3),
+        }
+        with self._lock:
+            self.cassette.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cassette, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+        return response
+
+
+class ReplayTransport(Transport):
+    """Answers requests from a cassette with simulated timing."""
+    
+    offline = True
+    
+    def __init__(
+        self,
+        cassette: Path,
+        latency: float = 0.0,
+        ttft: float = 0.0,
+        tokens_per_sec: float = 0.0
+    ):
+        """
+        Load a cassette.
+        
+        Args:
+            cassette: JSON-lines file written by RecordingTransport
+            latency: Fixed delay before anything happens (network round trip)
+            ttft: Additional delay until the first token
+            tokens_per_sec: Generation speed for the rest of the response
+                (0 = instant)
+        
+        Raises:
+            TransportError: If the cassette does not exist
+        """
+        if not cassette.exists():
+            raise TransportError(f"Cassette not found: {cassette}")
+        
+        self.latency = latency
+        self.ttft = ttft
+        self.tokens_per_sec = tokens_per_sec
+        self.responses: Dict[str, str] = {}
+        
+        with open(cassette, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self.responses[entry["key"]] = entry["response"]
+    
+    def send(self, provider, request, call, first_token=None) -> str:
+        key = request_key(provider, request)
+        if key not in self.responses:
+            raise TransportError(
+                f"No recorded {provider} response for this request; "
+                "re-record the cassette with LLM_TRANSPORT=record"
+            )
+        response = self.responses[key]
+        
+        time.sleep(self.latency + self.ttft)
+        if first_token is not None:
+            first_token.set()
+        if self.tokens_per_sec > 0:
+            # Same ~4 characters per token heuristic as the summarizers
+            time.sleep((len(response) // 4 + 1) / self.tokens_per_sec)
+        return response
+
+
+_transport: Optional[Transport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> Transport:
+    """
+    Return the process-wide transport configured by LLM_TRANSPORT.
+    
+    Returns:
+        Shared Transport instance
+    
+    Raises:
+        TransportError: If the configuration is invalid
+    """
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            mode = Config.LLM_TRANSPORT
+            cassette = Path(Config.LLM_CASSETTE)
+            if mode == "live":
+                _transport = Transport()
+            elif mode == "record":
+                _transport = RecordingTransport(cassette)
+            elif mode == "replay":
+                _transport = ReplayTransport(
+                    cassette,
+                    latency=Config.REPLAY_LATENCY,
+                    ttft=Config.REPLAY_TTFT,
+                    tokens_per_sec=Config.REPLAY_TOKENS_PER_SEC
+                )
+            else:
+                raise TransportError(f"Unknown LLM_TRANSPORT: {mode}")
+        return _transport
@@ -0,0 +1,127 @@
+"""
+Shared fixtures: a local mock of Ollama's chat API and commit builders.
+"""
+
+import json
+import re
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Optional
+
+import pytest
+
+from dev_standup.config import Config
+from dev_standup.git_scanner import CommitInfo
+from dev_standup.prompts import REPO_SECTION_MARKER
+
+_SECTION_RE = re.compile(r"^" + re.escape(REPO_SECTION_MARKER) + r" (.+)$", re.MULTILINE)
+
+
+def packed_names(user_prompt: str) -> List[str]:
+    """Repository names a packed prompt asks about, in order."""
+    return _SECTION_RE.findall(user_prompt)
+
+
+def default_reply(user_prompt: str) -> str:
+    """Answer every requested section, or give a plain summary."""
+    names = packed_names(user_prompt)
+    if names:
+        return "\n".join(f"{REPO_SECTION_MARKER} {name}\n- worked on {name}" for name in names)
+    return "- worked on things"
+
+
+class MockOllama:
+    """Threaded stand-in for ``/api/chat`` and ``/api/tags`` that records requests and warm-ups."""
+    
+    def __init__(self, reply: Callable[[str], str] = default_reply):
+        self.reply = reply
+        self.requests: List[dict] = []
+        self.warm_ups: List[dict] = []
+        self._lock = threading.Lock()
+        mock = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+            
+            def do_GET(self):
+                self._send({"models": [{"name": Config.OLLAMA_MODEL}]})
+            
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                messages = body.get("messages", [])
+                if not messages:
+                    # Warm-up request: load the model, generate nothing
+                    with mock._lock:
+                        mock.warm_ups.append(body)
+                    self._send({"done": True})
+                    return
+                with mock._lock:
+                    mock.requests.append(body)
+                text = mock.reply(messages[-1]["content"])
+                if text is None:
+                    # A reply of None plays a failing backend
+                    self.send_error(500)
+                    return
+                self._send({
+                    "message": {"role": "assistant", "content": text},
+                    "done": True,
+                })
+            
+            def _send(self, payload: dict):
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+        
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+    
+    @property
+    def user_prompts(self) -> List[str]:
+        """User prompts of the chat requests received so far."""
+        with self._lock:
+            return [r["messages"][-1]["content"] for r in self.requests]
+    
+    def start(self) -> "MockOllama":
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def mock_ollama(monkeypatch):
+    """Run a MockOllama and point the Ollama provider at it."""
+    server = MockOllama().start()
+    monkeypatch.setattr(Config, "OLLAMA_BASE_URL", server.url)
+    monkeypatch.setattr(Config, "LLM_PROVIDER", "ollama")
+    monkeypatch.setattr(Config, "LLM_FALLBACK", "")
+    yield server
+    server.stop()
+
+
+def make_commits(repo_name: str, count: int = 2, message: Optional[str] = None) -> List[CommitInfo]:
+    """Build ``count`` recent commits for ``repo_name``."""
+    now = datetime.now()
+    return [
+        CommitInfo(
+            sha=f"{abs(hash((repo_name, i))):08x}"[:8],
+            message=message or f"feat: change {i} in {repo_name}",
+            author="Alice",
+            timestamp=now - timedelta(minutes=i),
+            files_changed=[f"src/{repo_name}/module_{i}.py"],
+            repo_name=repo_name,
+            author_email="alice@example.com",
+            insertions=10,
+            deletions=2,
+        )
+        for i in range(count)
+    ]
@@ -0,0 +1,77 @@
+"""
+Batch runner: resuming after an outage and the final report.
+"""
+
+import re
+import subprocess
+from pathlib import Path
+from typing import List
+
+from dev_standup.batch import BatchJob, BatchRunner
+
+from conftest import default_reply
+
+REPOS = ("alpha", "beta", "gamma")
+
+
+def _repos(root: Path) -> List[Path]:
+    git = ["git", "-c", "user.name=Alice", "-c", "user.email=alice@example.com"]
+    repos = []
+    for name in REPOS:
+        repo = root / name
+        repo.mkdir()
+        subprocess.run(git + ["init", "-q"], cwd=repo, check=True)
+        (repo / "app.py").write_text(f"NAME = {name!r}\n")
+        subprocess.run(git + ["add", "-A"], cwd=repo, check=True)
+        subprocess.run(git + ["commit", "-qm", f"feat: work on {name}"], cwd=repo, check=True)
+        repos.append(repo)
+    return repos
+
+
+def _prompted_repos(prompts: List[str]) -> List[str]:
+    return [re.search(r"work on (\w+)", prompt).group(1) for prompt in prompts]
+
+
+def _runner(job: BatchJob, state_dir: Path) -> BatchRunner:
+    return BatchRunner(
+        job, state_dir, scan_workers=1, llm_workers=1, retries=0, max_consecutive_failures=1
+    )
+
+
+def test_rerun_resumes_only_missing_units(mock_ollama, tmp_path):
+    job = BatchJob(repos=_repos(tmp_path))
+    state_dir = tmp_path / "state"
+    
+    def flaky(prompt: str):
+        # The backend answers once, then goes down: the outage stops the run
+        return default_reply(prompt) if len(mock_ollama.requests) == 1 else None
+    
+    mock_ollama.reply = flaky
+    first = _runner(job, state_dir).run()
+    assert (first.units_done, first.units_failed) == (1, 2)
+    [done] = _prompted_repos(mock_ollama.user_prompts[:1])
+    
+    # Back up: only the two missing units are sent
+    mock_ollama.reply = default_reply
+    sent_before = len(mock_ollama.requests)
+    second = _runner(job, state_dir).run()
+    assert (second.units_resumed, second.units_done, second.units_failed) == (1, 2, 0)
+    assert sorted(_prompted_repos(mock_ollama.user_prompts[sent_before:])) == sorted(
+        set(REPOS) - {done}
+    )
+    
+    # Different settings change the fingerprint and start fresh
+    job.hours += 24
+    third = _runner(job, state_dir).run()
+    assert (third.units_resumed, third.units_done) == (0, 3)
+
+
+def test_report_skips_people_without_commits(mock_ollama, tmp_path):
+    job = BatchJob(repos=_repos(tmp_path), people=["alice@example.com", "nobody@example.com"])
+    
+    runner = _runner(job, tmp_path / "state")
+    runner.run()
+    report = runner.write_report().read_text(encoding="utf-8")
+    
+    assert "# alice@example.com" in report
+    assert "nobody@example.com" not in report
@@ -0,0 +1,84 @@
+"""
+Document output formats keep stdout clean, even when nothing was found.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from dev_standup.git_scanner import GitScanner
+
+
+def _run_cli(cwd: Path, *args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, LLM_PROVIDER="extractive", LLM_FALLBACK="", LLM_TRANSPORT="live")
+    env["PYTHONPATH"] = str(Path(__file__).resolve().parents[1])
+    return subprocess.run(
+        [sys.executable, "-m", "dev_standup.cli", *args],
+        cwd=cwd, env=env, capture_output=True, text=True, timeout=60
+    )
+
+
+def _init_repo(path: Path, commit: bool = True) -> Path:
+    git = ["git", "-c", "user.name=Alice", "-c", "user.email=alice@example.com"]
+    path.mkdir(exist_ok=True)
+    subprocess.run(git + ["init", "-q"], cwd=path, check=True)
+    if commit:
+        (path / "app.py").write_text("VALUE = 1\n")
+        subprocess.run(git + ["add", "-A"], cwd=path, check=True)
+        subprocess.run(git + ["commit", "-qm", "feat: add value"], cwd=path, check=True)
+    return path
+
+
+@pytest.fixture
+def repo(tmp_path) -> Path:
+    return _init_repo(tmp_path)
+
+
+def test_json_with_commits(repo):
+    result = _run_cli(repo, "--all-authors", "--mood", "neutral", "--mood", "hero", "--format", "json")
+    
+    assert result.returncode == 0, result.stderr
+    document = json.loads(result.stdout)
+    assert document["moods"] == ["neutral", "hero"]
+    [entry] = document["repositories"]
+    assert set(entry["summaries"]) == {"neutral", "hero"}
+
+
+def test_json_across_repositories_is_clean_and_ordered(tmp_path):
+    for name in ("delta", "alpha", "echo", "charlie", "bravo"):
+        _init_repo(tmp_path / name)
+    # Scanning a repository without any commit fails with a warning
+    _init_repo(tmp_path / "empty", commit=False)
+    
+    result = _run_cli(tmp_path, "--all-repos", "--all-authors", "--format", "json")
+    
+    assert result.returncode == 0, result.stderr
+    assert "Error scanning" in result.stderr
+    names = [entry["name"] for entry in json.loads(result.stdout)["repositories"]]
+    expected = [path.name for path in GitScanner().find_repositories(tmp_path)]
+    assert names == [name for name in expected if name != "empty"]
+
+
+def test_json_without_commits_is_still_a_document(repo):
+    result = _run_cli(repo, "--hours", "0", "--format", "json")
+    
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout)["repositories"] == []
+
+
+def test_markdown_without_repositories_prints_the_title(tmp_path):
+    result = _run_cli(tmp_path, "--all-repos", "--format", "markdown")
+    
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.startswith("# Standup summary")
+
+
+def test_errors_print_no_document(tmp_path):
+    result = _run_cli(tmp_path, "--repo", str(tmp_path / "missing"), "--format", "json")
+    
+    assert result.returncode == 1
+    assert result.stdout == ""
@@ -0,0 +1,62 @@
+"""
+Diff context budgets and truncation.
+"""
+
+import subprocess
+from pathlib import Path
+
+from dev_standup.git_scanner import GitScanner
+
+
+def _git(repo: Path, *args: str):
+    subprocess.run(
+        ["git", "-c", "user.name=Alice", "-c", "user.email=alice@example.com", *args],
+        cwd=repo, check=True, capture_output=True
+    )
+
+
+def _repo_with_commits(root: Path, name: str, count: int) -> Path:
+    repo = root / name
+    (repo / "services" / "payments").mkdir(parents=True)
+    _git(repo, "init", "-q")
+    for i in range(count):
+        source = repo / "services" / "payments" / f"pay_{i}.py"
+        source.write_text("".join(f"def handler_{i}_{n}():\n    return {n}\n" for n in range(5)))
+        _git(repo, "add", "-A")
+        _git(repo, "commit", "-qm", f"feat: payments {i}")
+    return repo
+
+
+def _contexts(scanner: GitScanner, repo: Path):
+    return [c.diff_context for c in scanner.scan_repository(repo)]
+
+
+def test_total_budget_applies_per_repository(tmp_path):
+    repos = [_repo_with_commits(tmp_path, name, 3) for name in ("alpha", "beta", "gamma")]
+    scanner = GitScanner(all_authors=True, diff_context=True, diff_bytes_total=300)
+    
+    for repo in repos:
+        contexts = _contexts(scanner, repo)
+        assert any(contexts), f"{repo.name} got no diff context"
+        assert sum(len(c) for c in contexts) <= 300
+    scanner.close()
+
+
+def test_truncation_keeps_whole_lines_and_no_bare_headers(tmp_path):
+    repo = _repo_with_commits(tmp_path, "alpha", 4)
+    
+    for total in range(0, 200, 7):
+        scanner = GitScanner(
+            all_authors=True, diff_context=True,
+            diff_bytes_per_commit=80, diff_bytes_total=total
+        )
+        for context in _contexts(scanner, repo):
+            assert len(context) <= 80
+            if not context:
+                continue
+            lines = context.split("\n")
+            # Starts with a complete file name and ends with one of its entries
+            assert lines[0].startswith("services/payments/pay_") and lines[0].endswith(".py")
+            assert lines[-1].startswith("  +def handler_")
+            assert all(line.startswith("  +def handler_") or line.endswith(".py") for line in lines)
+        scanner.close()
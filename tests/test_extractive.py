@@ -0,0 +1,55 @@
+"""
+Wording of the extractive (no-LLM) summaries.
+"""
+
+from unittest import mock
+
+from dev_standup import extractive
+from dev_standup.extractive import MOOD_TEMPLATES, extractive_summary
+
+from conftest import make_commits
+
+
+def test_description_verb_is_not_doubled():
+    commits = make_commits("pay", 1, "feat: add pay endpoint")
+    
+    summary = extractive_summary(commits, "neutral")
+    
+    assert "Added pay endpoint" in summary
+    assert "Added add" not in summary
+
+
+def test_templates_without_verb_slot_keep_the_verb():
+    commits = make_commits("pay", 1, "feat: add pay endpoint")
+    templates = MOOD_TEMPLATES["hero"]
+    index = next(i for i, t in enumerate(templates) if "{verb}" not in t)
+    
+    with mock.patch.object(extractive.zlib, "crc32", return_value=index):
+        summary = extractive_summary(commits, "hero")
+    
+    assert "added pay endpoint" in summary
+
+
+def test_lock_and_root_files_do_not_pick_the_area():
+    [commit] = make_commits("shop", 1, "feat: add checkout")
+    commit.files_changed = ["package-lock.json", "yarn.lock", "README.md", "src/api/checkout.py"]
+    
+    assert "in src/api" in extractive_summary([commit], "neutral")
+
+
+def test_acronyms_and_names_keep_their_case():
+    for message, expected in [
+        ("feat: OAuth login for admins", "Added OAuth login"),
+        ("feat: API keys for bots", "Added API keys"),
+        ("feat: Login page", "Added login page"),
+    ]:
+        assert expected in extractive_summary(make_commits("auth", 1, message), "neutral")
+
+
+def test_standards_are_not_tickets():
+    commits = make_commits("io", 1, "fix: handle UTF-8 decoding in SHA-256 checks (PAY-12, #7)")
+    
+    summary = extractive_summary(commits, "neutral")
+    
+    assert "UTF-8 decoding in SHA-256 checks" in summary
+    assert "[PAY-12, #7]" in summary
@@ -0,0 +1,108 @@
+"""
+Provider chains: circuit breakers, hedging and sharing across moods.
+"""
+
+import time
+
+from dev_standup.config import Config
+from dev_standup.failover import CircuitBreaker, ProviderChain
+from dev_standup.summarizer import (
+    BaseSummarizer,
+    OllamaSummarizer,
+    SummarizerError,
+    create_summarizers,
+    summarize_moods,
+)
+from dev_standup.transport import Transport
+
+from conftest import make_commits
+
+
+class _Scripted(BaseSummarizer):
+    """Provider that answers (or fails) after a fixed delay."""
+    
+    def __init__(self, answer=None, delay=0.0):
+        super().__init__("neutral", transport=Transport())
+        self.answer = answer
+        self.delay = delay
+    
+    def complete(self, user_prompt, max_tokens=0, first_token=None):
+        time.sleep(self.delay)
+        if self.answer is None:
+            raise SummarizerError("down")
+        if first_token is not None:
+            first_token.set()
+        return self.answer
+
+
+class PrimarySummarizer(_Scripted):
+    pass
+
+
+class BackupSummarizer(_Scripted):
+    pass
+
+
+def _half_open(chain: ProviderChain, name: str) -> CircuitBreaker:
+    breaker = chain.breakers[name] = CircuitBreaker(reset_timeout=0.1)
+    breaker.trip()
+    time.sleep(0.15)
+    return breaker
+
+
+def test_unused_fallback_keeps_its_trial_slot():
+    chain = ProviderChain(
+        "neutral", [PrimarySummarizer("primary"), BackupSummarizer("backup")], probe=False
+    )
+    backup = _half_open(chain, "backup")
+    
+    assert chain.complete("prompt") == "primary"
+    
+    # The backup was never started, so its half-open trial is still available
+    assert backup.allow()
+
+
+def test_abandoned_hedge_releases_its_trial_slot():
+    chain = ProviderChain(
+        "neutral",
+        [PrimarySummarizer("slow", delay=0.3), BackupSummarizer("backup")],
+        hedge_after=0.05,
+        probe=False,
+    )
+    primary = _half_open(chain, "primary")
+    
+    assert chain.complete("prompt") == "backup"
+    
+    # The losing trial still finished and closed its breaker
+    time.sleep(0.4)
+    assert primary.opened_at is None
+    assert primary.allow()
+
+
+def test_moods_share_one_probe_and_breakers(monkeypatch):
+    monkeypatch.setattr(Config, "LLM_PROVIDER", "ollama")
+    monkeypatch.setattr(Config, "LLM_FALLBACK", "extractive")
+    monkeypatch.setattr(Config, "HEDGE_AFTER", 0.0)
+    probes = []
+    
+    def dead(self):
+        probes.append(self.mood)
+        return False
+    
+    monkeypatch.setattr(OllamaSummarizer, "health_check", dead)
+    monkeypatch.setattr(OllamaSummarizer, "complete", lambda *a, **k: _tripped_provider_called())
+    
+    summarizers = create_summarizers(["neutral", "hero", "roast"])
+    
+    assert probes == ["neutral"]
+    assert len({id(s.breakers) for s in summarizers.values()}) == 1
+    assert summarizers["roast"].breakers["ollama"].opened_at is not None
+    
+    # Every mood skips the tripped provider and answers from the fallback
+    summaries = summarize_moods(summarizers, make_commits("alpha"))
+    assert list(summaries) == ["neutral", "hero", "roast"]
+    assert all(summary.startswith("•") for summary in summaries.values())
+
+
+def _tripped_provider_called():
+    raise AssertionError("a tripped provider was called")
@@ -0,0 +1,113 @@
+"""
+Commit selection: time window, path filters, history walks and the merged timeline.
+"""
+
+import os
+import subprocess
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional, Union
+
+import pytest
+
+from git import Repo
+
+from dev_standup.git_scanner import GitScanner
+
+
+def _commit(repo: Path, paths: Union[str, List[str]], message: str, when: Optional[datetime] = None):
+    for path in [paths] if isinstance(paths, str) else paths:
+        target = repo / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(f"{message}\n")
+    when = when or datetime.now() - timedelta(hours=1)
+    env = dict(os.environ, GIT_AUTHOR_DATE=when.isoformat(), GIT_COMMITTER_DATE=when.isoformat())
+    git = ["git", "-c", "user.name=Alice", "-c", "user.email=alice@example.com"]
+    subprocess.run(git + ["add", "-A"], cwd=repo, check=True, env=env)
+    subprocess.run(git + ["commit", "-qm", message], cwd=repo, check=True, env=env)
+
+
+def _repo(root: Path, name: str) -> Path:
+    repo = root / name
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+    return repo
+
+
+def test_only_commits_inside_the_window_are_read(tmp_path):
+    repo = _repo(tmp_path, "alpha")
+    now = datetime.now()
+    for days in (30, 20, 10):
+        _commit(repo, "app.py", f"old {days}", now - timedelta(days=days))
+    _commit(repo, "app.py", "recent", now - timedelta(hours=1))
+    
+    with GitScanner(hours=24, all_authors=True) as scanner:
+        assert [c.message for c in scanner.scan_repository(repo)] == ["recent"]
+
+
+@pytest.fixture
+def layout_repo(tmp_path) -> Path:
+    repo = _repo(tmp_path, "shop")
+    _commit(repo, ["services/payments/pay.py", "docs/guide.md"], "payments and docs")
+    _commit(repo, "services/users/user.py", "users")
+    _commit(repo, "setup.py", "setup")
+    _commit(repo, "docs/guide.md", "docs")
+    return repo
+
+
+@pytest.mark.parametrize("path, expected", [
+    # Directory: only the in-scope file of the mixed commit is reported
+    ("services/payments", {"payments and docs": ["services/payments/pay.py"]}),
+    # File
+    ("docs/guide.md", {"payments and docs": ["docs/guide.md"], "docs": ["docs/guide.md"]}),
+    # ** spans directories
+    ("**/*.py", {
+        "payments and docs": ["services/payments/pay.py"],
+        "users": ["services/users/user.py"],
+        "setup": ["setup.py"],
+    }),
+    # Glob magic: * stays in one directory, so this only matches the root
+    ("*.py", {"setup": ["setup.py"]}),
+])
+def test_path_filters(layout_repo, path, expected):
+    with GitScanner(hours=24, all_authors=True, paths=[path]) as scanner:
+        commits = scanner.scan_repository(layout_repo)
+    
+    assert {c.message: c.files_changed for c in commits} == expected
+    assert all(c.insertions == len(c.files_changed) for c in commits)
+
+
+def test_one_history_walk_per_repository(tmp_path, monkeypatch):
+    repo = _repo(tmp_path, "alpha")
+    now = datetime.now()
+    for i in range(120):
+        _commit(repo, "app.py", f"change {i}", now - timedelta(minutes=i + 1))
+    
+    walks = []
+    iter_commits = Repo.iter_commits
+    
+    def counting_iter_commits(self, *args, **kwargs):
+        walks.append(kwargs)
+        return iter_commits(self, *args, **kwargs)
+    
+    monkeypatch.setattr(Repo, "iter_commits", counting_iter_commits)
+    with GitScanner(hours=24, all_authors=True) as scanner:
+        assert len(scanner.scan_repository(repo)) == 120
+    
+    assert len(walks) == 1
+    assert "since" in walks[0] and "date_order" not in walks[0]
+
+
+def test_timeline_is_chronological_across_repositories(tmp_path):
+    now = datetime.now()
+    alpha, beta = _repo(tmp_path, "alpha"), _repo(tmp_path, "beta")
+    # Commit dates out of parent order, as after a rebase or cherry-pick
+    _commit(alpha, "a.py", "a1", now - timedelta(hours=2))
+    _commit(alpha, "a.py", "a2", now - timedelta(hours=5))
+    _commit(beta, "b.py", "b1", now - timedelta(hours=3))
+    _commit(beta, "b.py", "b2", now - timedelta(hours=1))
+    
+    with GitScanner(hours=24, all_authors=True) as scanner:
+        timeline = [c.message for c in scanner.iter_timeline([alpha, beta])]
+    
+    assert timeline == ["b2", "a1", "b1", "a2"]
@@ -0,0 +1,42 @@
+"""
+Requests the Ollama provider sends to /api/chat.
+"""
+
+import pytest
+
+from dev_standup.config import Config
+from dev_standup.summarizer import OllamaSummarizer
+from dev_standup.transport import Transport
+
+
+def test_chat_splits_system_and_user_messages(mock_ollama):
+    summarizer = OllamaSummarizer("neutral", transport=Transport())
+    
+    assert summarizer.complete("Summarize these commits") == "- worked on things"
+    
+    [request] = mock_ollama.requests
+    assert request["model"] == Config.OLLAMA_MODEL
+    assert request["messages"] == [
+        {"role": "system", "content": summarizer.system_prompt},
+        {"role": "user", "content": "Summarize these commits"},
+    ]
+    assert request["keep_alive"] == "30m"
+
+
+@pytest.mark.parametrize("setting, sent", [("-1", -1), ("0", 0), ("3600", 3600), ("2h", "2h")])
+def test_keep_alive_numbers_are_sent_as_numbers(mock_ollama, monkeypatch, setting, sent):
+    monkeypatch.setattr(Config, "OLLAMA_KEEP_ALIVE", setting)
+    summarizer = OllamaSummarizer("neutral", transport=Transport())
+    
+    summarizer.complete("prompt")
+    
+    assert mock_ollama.requests[0]["keep_alive"] == sent
+
+
+def test_warm_up_sends_an_empty_preload(mock_ollama, monkeypatch):
+    monkeypatch.setattr(Config, "OLLAMA_KEEP_ALIVE", "-1")
+    
+    assert OllamaSummarizer("neutral", transport=Transport()).warm_up()
+    
+    assert mock_ollama.warm_ups == [{"model": Config.OLLAMA_MODEL, "messages": [], "keep_alive": -1}]
+    assert mock_ollama.requests == []
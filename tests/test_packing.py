@@ -0,0 +1,56 @@
+"""
+Request packing against a local mock Ollama server.
+"""
+
+from dev_standup.summarizer import OllamaSummarizer
+from dev_standup.transport import Transport
+
+from conftest import default_reply, make_commits, packed_names
+
+
+def _summarizer() -> OllamaSummarizer:
+    return OllamaSummarizer("neutral", transport=Transport())
+
+
+def test_small_repos_share_one_request(mock_ollama):
+    repos = {name: make_commits(name) for name in ("alpha", "beta", "gamma")}
+    
+    summaries = _summarizer().summarize_packed(repos, token_budget=1500, max_repos=8)
+    
+    assert len(mock_ollama.requests) == 1
+    assert packed_names(mock_ollama.user_prompts[0]) == ["alpha", "beta", "gamma"]
+    assert list(summaries) == ["alpha", "beta", "gamma"]
+    for name, summary in summaries.items():
+        assert summary == f"- worked on {name}"
+
+
+def test_tight_budget_falls_back_to_one_request_per_repo(mock_ollama):
+    repos = {name: make_commits(name) for name in ("alpha", "beta", "gamma")}
+    
+    summaries = _summarizer().summarize_packed(repos, token_budget=10, max_repos=8)
+    
+    assert len(mock_ollama.requests) == 3
+    assert all(not packed_names(prompt) for prompt in mock_ollama.user_prompts)
+    assert all(summary == "- worked on things" for summary in summaries.values())
+
+
+def test_missing_section_is_summarized_individually(mock_ollama):
+    def drop_beta(user_prompt: str) -> str:
+        reply = default_reply(user_prompt)
+        return reply.replace("### REPO: beta\n- worked on beta\n", "")
+    
+    mock_ollama.reply = drop_beta
+    repos = {name: make_commits(name) for name in ("alpha", "beta", "gamma")}
+    
+    summaries = _summarizer().summarize_packed(repos, token_budget=1500, max_repos=8)
+    
+    prompts = mock_ollama.user_prompts
+    assert len(prompts) == 2
+    assert packed_names(prompts[0]) == ["alpha", "beta", "gamma"]
+    assert not packed_names(prompts[1])
+    assert "beta" in prompts[1] and "alpha" not in prompts[1]
+    assert summaries == {
+        "alpha": "- worked on alpha",
+        "beta": "- worked on things",
+        "gamma": "- worked on gamma",
+    }
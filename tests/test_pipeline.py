@@ -0,0 +1,128 @@
+"""
+Pipelined scanning and summarization: overlap, backpressure and shutdown.
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from dev_standup.pipeline import ScanSummarizePipeline
+from dev_standup.summarizer import ExtractiveSummarizer
+from dev_standup.transport import Transport
+
+from conftest import make_commits
+
+
+class FakeScanner:
+    """Scanner that returns made-up commits after a delay."""
+    
+    def __init__(self, delay: float = 0.0, empty=()):
+        self.delay = delay
+        self.empty = set(empty)
+        self.started: List[str] = []
+        self.finished_at: List[float] = []
+        self._lock = threading.Lock()
+    
+    def scan_repository(self, repo_path: Path):
+        with self._lock:
+            self.started.append(repo_path.name)
+        time.sleep(self.delay)
+        with self._lock:
+            self.finished_at.append(time.perf_counter())
+        return [] if repo_path.name in self.empty else make_commits(repo_path.name)
+
+
+class FakeSummarizer(ExtractiveSummarizer):
+    """Extractive summarizer that can be slowed down or held, and counts concurrency."""
+    
+    def __init__(self, delay: float = 0.0, gate: Optional[threading.Event] = None):
+        super().__init__("neutral", transport=Transport())
+        self.delay = delay
+        self.gate = gate
+        self.started_at: List[float] = []
+        self.repos: List[str] = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+    
+    def generate(self, commits, first_token=None, commits_text=None):
+        with self._lock:
+            self.started_at.append(time.perf_counter())
+            self.repos.append(commits[0].repo_name)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        if self.gate is not None:
+            self.gate.wait(5)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        return super().generate(commits)
+
+
+def _paths(count: int) -> List[Path]:
+    return [Path(f"/repos/repo{i}") for i in range(count)]
+
+
+def test_llm_starts_before_scanning_ends():
+    scanner = FakeScanner(delay=0.05)
+    summarizer = FakeSummarizer(delay=0.05)
+    pipeline = ScanSummarizePipeline(scanner, summarizer, scan_workers=1, llm_workers=1)
+    
+    results = list(pipeline.run(_paths(6)))
+    
+    assert len(results) == 6
+    assert min(summarizer.started_at) < max(scanner.finished_at)
+
+
+def test_repositories_without_commits_are_skipped():
+    scanner = FakeScanner(empty={"repo1", "repo3"})
+    summarizer = FakeSummarizer()
+    
+    results = list(ScanSummarizePipeline(scanner, summarizer).run(_paths(5)))
+    
+    assert sorted(r.repo_name for r in results) == ["repo0", "repo2", "repo4"]
+    assert sorted(summarizer.repos) == ["repo0", "repo2", "repo4"]
+
+
+def test_several_llm_workers_run_concurrently():
+    summarizer = FakeSummarizer(delay=0.1)
+    pipeline = ScanSummarizePipeline(FakeScanner(), summarizer, scan_workers=2, llm_workers=3)
+    
+    assert len(list(pipeline.run(_paths(6)))) == 6
+    assert summarizer.max_running == 3
+
+
+def test_full_queues_pause_scanning():
+    gate = threading.Event()
+    scanner = FakeScanner()
+    pipeline = ScanSummarizePipeline(
+        scanner, FakeSummarizer(gate=gate), scan_workers=1, llm_workers=1, queue_size=1
+    )
+    results = []
+    consumer = threading.Thread(target=lambda: results.extend(pipeline.run(_paths(20))))
+    consumer.start()
+    
+    time.sleep(0.3)
+    # One repository at the LLM, one queued, one waiting in the scanner
+    assert len(scanner.started) <= 3
+    
+    gate.set()
+    consumer.join(5)
+    assert len(results) == 20
+
+
+def test_stopping_early_releases_the_workers():
+    before = set(threading.enumerate())
+    pipeline = ScanSummarizePipeline(
+        FakeScanner(), FakeSummarizer(delay=0.01), scan_workers=2, llm_workers=2, queue_size=1
+    )
+    
+    results = pipeline.run(_paths(50))
+    next(results)
+    results.close()
+    
+    deadline = time.monotonic() + 2
+    while set(threading.enumerate()) - before and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not set(threading.enumerate()) - before
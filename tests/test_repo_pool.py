@@ -0,0 +1,96 @@
+"""
+Stress test: git helper processes and file descriptors stay bounded.
+"""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from dev_standup.git_scanner import GitScanner
+
+REPO_COUNT = 500
+MAX_OPEN = 8
+
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.skipif(not Path("/proc/self/fd").exists(), reason="needs /proc"),
+]
+
+
+def _child_processes() -> int:
+    me = str(os.getpid())
+    count = 0
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # Fields after the ")" closing the command name: state, ppid, ...
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        if fields[1] == me:
+            count += 1
+    return count
+
+
+def _open_fds() -> int:
+    return len(os.listdir("/proc/self/fd"))
+
+
+@pytest.fixture(scope="module")
+def many_repos(tmp_path_factory) -> List[Path]:
+    root = tmp_path_factory.mktemp("repos")
+    template = root / "template"
+    template.mkdir()
+    git = ["git", "-c", "user.name=Alice", "-c", "user.email=alice@example.com"]
+    subprocess.run(git + ["init", "-q"], cwd=template, check=True)
+    for i in range(3):
+        (template / "app.py").write_text(f"VALUE = {i}\n")
+        subprocess.run(git + ["add", "-A"], cwd=template, check=True)
+        subprocess.run(git + ["commit", "-qm", f"feat: change {i}"], cwd=template, check=True)
+    
+    repos = []
+    for i in range(REPO_COUNT):
+        repo = root / f"repo{i:03d}"
+        shutil.copytree(template, repo)
+        repos.append(repo)
+    return repos
+
+
+def test_scans_keep_processes_and_fds_bounded(many_repos):
+    base_fds = _open_fds()
+    # Each Repo handle may run two cat-file helpers with three pipes each
+    max_children = 2 * MAX_OPEN + 2
+    max_fds = base_fds + 6 * MAX_OPEN + 16
+    peak_children = peak_fds = 0
+    
+    def sample():
+        nonlocal peak_children, peak_fds
+        peak_children = max(peak_children, _child_processes())
+        peak_fds = max(peak_fds, _open_fds())
+    
+    scanner = GitScanner(all_authors=True, max_open_repos=MAX_OPEN)
+    for i, repo in enumerate(many_repos):
+        assert len(scanner.scan_repository(repo)) == 3
+        if i % 25 == 0:
+            sample()
+    
+    # The merged timeline keeps every repository's iterator alive at once
+    seen = 0
+    for commit in scanner.iter_timeline(many_repos):
+        seen += 1
+        if seen % 100 == 0:
+            sample()
+    assert seen == 3 * REPO_COUNT
+    
+    assert peak_children <= max_children
+    assert peak_fds <= max_fds
+    
+    scanner.close()
+    assert _child_processes() == 0
+    assert _open_fds() <= base_fds + 2
@@ -0,0 +1,41 @@
+"""
+Stored daily summaries and their reuse across rollups.
+"""
+
+from dev_standup.config import Config
+from dev_standup.git_scanner import GitScanner
+from dev_standup.rollup import SummaryStore, build_rollup, summary_variant
+from dev_standup.summarizer import ExtractiveSummarizer
+from dev_standup.transport import Transport
+
+from conftest import make_commits
+
+
+def test_unchanged_days_are_reused(tmp_path):
+    store = SummaryStore(tmp_path / "store")
+    summarizer = ExtractiveSummarizer("neutral", transport=Transport())
+    variant = summary_variant("neutral", GitScanner())
+    commits = make_commits("alpha", 3)
+    
+    first = build_rollup(tmp_path, commits, summarizer, store, variant, days=7)
+    second = build_rollup(tmp_path, commits, summarizer, store, variant, days=7)
+    
+    assert [d.reused for d in first] == [False]
+    assert [d.reused for d in second] == [True]
+    assert second[0].summary == first[0].summary
+
+
+def test_variant_changes_with_provider_and_model(monkeypatch):
+    scanner = GitScanner()
+    monkeypatch.setattr(Config, "LLM_FALLBACK", "")
+    
+    monkeypatch.setattr(Config, "LLM_PROVIDER", "extractive")
+    extractive = summary_variant("neutral", scanner)
+    monkeypatch.setattr(Config, "LLM_PROVIDER", "ollama")
+    ollama = summary_variant("neutral", scanner)
+    monkeypatch.setattr(Config, "OLLAMA_MODEL", "another-model")
+    other_model = summary_variant("neutral", scanner)
+    monkeypatch.setattr(Config, "LLM_FALLBACK", "extractive")
+    with_fallback = summary_variant("neutral", scanner)
+    
+    assert len({extractive, ollama, other_model, with_fallback}) == 4
@@ -0,0 +1,49 @@
+"""
+Recording LLM traffic and replaying it offline with simulated timing.
+"""
+
+import threading
+import time
+
+import pytest
+
+from dev_standup.summarizer import OllamaSummarizer
+from dev_standup.transport import RecordingTransport, ReplayTransport, TransportError
+
+from conftest import make_commits
+
+
+def test_record_then_replay_offline(mock_ollama, tmp_path):
+    cassette = tmp_path / "cassette.jsonl"
+    commits = make_commits("alpha", 3)
+    mock_ollama.reply = lambda prompt: "- shipped alpha " + "x" * 400
+    
+    recorded = OllamaSummarizer("neutral", transport=RecordingTransport(cassette)).generate(commits)
+    mock_ollama.stop()
+    
+    replay = ReplayTransport(cassette, latency=0.1, ttft=0.1, tokens_per_sec=500)
+    summarizer = OllamaSummarizer("neutral", transport=replay)
+    first_token = threading.Event()
+    first_token_at = []
+    threading.Thread(
+        target=lambda: first_token_at.append(first_token.wait(5) and time.perf_counter()),
+        daemon=True
+    ).start()
+    
+    started = time.perf_counter()
+    replayed = summarizer.generate(commits, first_token=first_token)
+    elapsed = time.perf_counter() - started
+    
+    assert replayed == recorded
+    assert len(mock_ollama.requests) == 1
+    # Latency plus time to first token, then ~100 tokens at 500 tokens/second
+    assert first_token_at and first_token_at[0] - started >= 0.2
+    assert elapsed >= 0.2 + (len(recorded) // 4 + 1) / 500
+    
+    with pytest.raises(TransportError):
+        summarizer.complete("a prompt that was never recorded")
+
+
+def test_replay_needs_a_cassette(tmp_path):
+    with pytest.raises(TransportError):
+        ReplayTransport(tmp_path / "missing.jsonl")